@@ -0,0 +1,4 @@
+"""Command line interface, run as `python -m mnemonic`."""
+from .mnemonic import main
+
+main()
@@ -0,0 +1,70 @@
+"""Base58 and Base58Check encoding as used by Bitcoin."""
+from __future__ import annotations
+
+import hashlib
+import typing as t
+
+ALPHABET = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+
+# Numbers are converted ten base58 digits at a time; within such a block the
+# digits are emitted in pairs looked up from a table of all 58 * 58 pairs.
+_BLOCK_DIGITS = 10
+_BLOCK = 58**_BLOCK_DIGITS
+_PAIRS = [a + b for a in ALPHABET for b in ALPHABET]
+_VALUES = {c: i for i, c in enumerate(ALPHABET)}
+
+
+def b58encode(v: bytes) -> str:
+    """Encode bytes to base58, each leading zero byte becomes a leading '1'."""
+    acc = int.from_bytes(v, byteorder="big")
+    pairs = _PAIRS
+    digits = []
+    while acc:
+        acc, block = divmod(acc, _BLOCK)
+        for _ in range(_BLOCK_DIGITS // 2):
+            block, pair = divmod(block, 58 * 58)
+            digits.append(pairs[pair])
+    digits.reverse()
+    zeros = len(v) - len(bytes(v).lstrip(b"\x00"))
+    return "1" * zeros + "".join(digits).lstrip("1")
+
+
+def b58decode(s: str) -> bytes:
+    """Decode a base58 string, each leading '1' becomes a leading zero byte."""
+    values = _VALUES
+    acc = 0
+    try:
+        for start in range(0, len(s), _BLOCK_DIGITS):
+            chunk = s[start : start + _BLOCK_DIGITS]
+            block = 0
+            for c in chunk:
+                block = block * 58 + values[c]
+            acc = acc * 58 ** len(chunk) + block
+    except KeyError as e:
+        raise ValueError(f"Invalid base58 character {e.args[0]!r}") from None
+    zeros = len(s) - len(s.lstrip("1"))
+    return b"\x00" * zeros + acc.to_bytes((acc.bit_length() + 7) // 8, "big")
+
+
+def checksum(v: bytes) -> bytes:
+    """Return the 4 byte Base58Check checksum, the start of a double SHA-256."""
+    return hashlib.sha256(hashlib.sha256(v).digest()).digest()[:4]
+
+
+def b58encode_check(v: bytes) -> str:
+    """Encode bytes to base58 with an appended checksum."""
+    return b58encode(bytes(v) + checksum(v))
+
+
+def b58decode_check(s: str) -> bytes:
+    """Decode a Base58Check string, raise ValueError if the checksum does not match."""
+    data = b58decode(s)
+    if len(data) < 4 or checksum(data[:-4]) != data[-4:]:
+        raise ValueError("Invalid base58 checksum")
+    return data[:-4]
+
+
+def b58encode_many(values: t.Iterable[bytes], check: bool = False) -> list[str]:
+    """Encode many byte strings, with checksums if `check` is set."""
+    encode = b58encode_check if check else b58encode
+    return [encode(v) for v in values]
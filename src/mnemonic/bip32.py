@@ -0,0 +1,405 @@
+"""BIP32 hierarchical deterministic key derivation over secp256k1.
+
+See https://github.com/bitcoin/bips/blob/master/bip-0032.mediawiki
+
+The curve arithmetic is plain Python: scalar multiplication branches on the
+bits of the private key and big integer operations take data dependent time.
+It is not side-channel resistant and must not be used with live keys where
+timing can be observed; it is meant for test vectors, tooling and recovery.
+"""
+from __future__ import annotations
+
+import collections
+import hashlib
+import hmac
+import struct
+import threading
+import typing as t
+
+from .base58 import b58decode_check, b58encode_check
+
+HARDENED = 0x80000000
+
+# Serialization versions: (private, public)
+MAINNET = (b"\x04\x88\xad\xe4", b"\x04\x88\xb2\x1e")
+TESTNET = (b"\x04\x35\x83\x94", b"\x04\x35\x87\xcf")
+
+# secp256k1 domain parameters
+_P = 2**256 - 2**32 - 977
+_N = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEBAAEDCE6AF48A03BBFD25E8CD0364141
+_G = (
+    0x79BE667EF9DCBBAC55A06295CE870B07029BFCDB2DCE28D959F2815B16F81798,
+    0x483ADA7726A3C4655DA4FBFC0E1108A8FD17B448A68554199C47D08FFB10D4B8,
+)
+
+_Point = t.Tuple[int, int]
+_Jacobian = t.Tuple[int, int, int]
+
+# Affine multiples G * 2**i, filled on first use
+_g_powers: list[_Point] = []
+_g_powers_lock = threading.Lock()
+
+
+def _double(p: _Jacobian) -> _Jacobian:
+    x, y, z = p
+    if not y:
+        return 0, 0, 0
+    yy = y * y % _P
+    s = 4 * x * yy % _P
+    m = 3 * x * x % _P
+    nx = (m * m - 2 * s) % _P
+    ny = (m * (s - nx) - 8 * yy * yy) % _P
+    return nx, ny, 2 * y * z % _P
+
+
+def _add(p: _Jacobian, q: _Point) -> _Jacobian:
+    """Add an affine point to a Jacobian one."""
+    x1, y1, z1 = p
+    if not z1:
+        return q[0], q[1], 1
+    zz = z1 * z1 % _P
+    h = (q[0] * zz - x1) % _P
+    r = (q[1] * zz * z1 - y1) % _P
+    if not h:
+        return _double(p) if not r else (0, 0, 0)
+    hh = h * h % _P
+    hhh = h * hh % _P
+    v = x1 * hh % _P
+    x3 = (r * r - hhh - 2 * v) % _P
+    y3 = (r * (v - x3) - y1 * hhh) % _P
+    return x3, y3, z1 * h % _P
+
+
+def _to_affine(p: _Jacobian) -> _Point:
+    x, y, z = p
+    if not z:
+        raise ValueError("Point at infinity")
+    zinv = pow(z, _P - 2, _P)
+    zinv2 = zinv * zinv % _P
+    return x * zinv2 % _P, y * zinv2 * zinv % _P
+
+
+def _multiply_g(k: int) -> _Point:
+    """Multiply the generator by `k` using the precomputed powers of two."""
+    if not _g_powers:
+        with _g_powers_lock:
+            if not _g_powers:
+                powers: list[_Point] = [_G]
+                for _ in range(255):
+                    powers.append(_to_affine(_double((*powers[-1], 1))))
+                _g_powers[:] = powers
+    acc: _Jacobian = (0, 0, 0)
+    i = 0
+    while k:
+        if k & 1:
+            acc = _add(acc, _g_powers[i])
+        k >>= 1
+        i += 1
+    return _to_affine(acc)
+
+
+def _serialize_point(p: _Point) -> bytes:
+    return bytes([2 + (p[1] & 1)]) + p[0].to_bytes(32, "big")
+
+
+def _parse_point(data: bytes) -> _Point:
+    if len(data) != 33 or data[0] not in (2, 3):
+        raise ValueError("Invalid compressed public key")
+    x = int.from_bytes(data[1:], "big")
+    yy = (pow(x, 3, _P) + 7) % _P
+    y = pow(yy, (_P + 1) // 4, _P)
+    if x >= _P or y * y % _P != yy:
+        raise ValueError("Invalid compressed public key")
+    if y & 1 != data[0] & 1:
+        y = _P - y
+    return x, y
+
+
+def _hash160(data: bytes) -> bytes:
+    digest = hashlib.sha256(data).digest()
+    try:
+        return hashlib.new("ripemd160", digest).digest()
+    except ValueError:  # not provided by this OpenSSL build
+        return _ripemd160(digest)
+
+
+# fmt: off
+_RMD_R = [
+    0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15,
+    7, 4, 13, 1, 10, 6, 15, 3, 12, 0, 9, 5, 2, 14, 11, 8,
+    3, 10, 14, 4, 9, 15, 8, 1, 2, 7, 0, 6, 13, 11, 5, 12,
+    1, 9, 11, 10, 0, 8, 12, 4, 13, 3, 7, 15, 14, 5, 6, 2,
+    4, 0, 5, 9, 7, 12, 2, 10, 14, 1, 3, 8, 11, 6, 15, 13,
+]
+_RMD_R2 = [
+    5, 14, 7, 0, 9, 2, 11, 4, 13, 6, 15, 8, 1, 10, 3, 12,
+    6, 11, 3, 7, 0, 13, 5, 10, 14, 15, 8, 12, 4, 9, 1, 2,
+    15, 5, 1, 3, 7, 14, 6, 9, 11, 8, 12, 2, 10, 0, 4, 13,
+    8, 6, 4, 1, 3, 11, 15, 0, 5, 12, 2, 13, 9, 7, 10, 14,
+    12, 15, 10, 4, 1, 5, 8, 7, 6, 2, 13, 14, 0, 3, 9, 11,
+]
+_RMD_S = [
+    11, 14, 15, 12, 5, 8, 7, 9, 11, 13, 14, 15, 6, 7, 9, 8,
+    7, 6, 8, 13, 11, 9, 7, 15, 7, 12, 15, 9, 11, 7, 13, 12,
+    11, 13, 6, 7, 14, 9, 13, 15, 14, 8, 13, 6, 5, 12, 7, 5,
+    11, 12, 14, 15, 14, 15, 9, 8, 9, 14, 5, 6, 8, 6, 5, 12,
+    9, 15, 5, 11, 6, 8, 13, 12, 5, 12, 13, 14, 11, 8, 5, 6,
+]
+_RMD_S2 = [
+    8, 9, 9, 11, 13, 15, 15, 5, 7, 7, 8, 11, 14, 14, 12, 6,
+    9, 13, 15, 7, 12, 8, 9, 11, 7, 7, 12, 7, 6, 15, 13, 11,
+    9, 7, 15, 11, 8, 6, 6, 14, 12, 13, 5, 14, 13, 13, 7, 5,
+    15, 5, 8, 11, 14, 14, 6, 14, 6, 9, 12, 9, 12, 5, 15, 8,
+    8, 5, 12, 9, 12, 5, 14, 6, 8, 13, 6, 5, 15, 13, 11, 11,
+]
+# fmt: on
+_RMD_K = [0x00000000, 0x5A827999, 0x6ED9EBA1, 0x8F1BBCDC, 0xA953FD4E]
+_RMD_K2 = [0x50A28BE6, 0x5C4DD124, 0x6D703EF3, 0x7A6D76E9, 0x00000000]
+
+
+def _rmd_f(j: int, x: int, y: int, z: int) -> int:
+    if j < 16:
+        return x ^ y ^ z
+    if j < 32:
+        return (x & y) | (~x & z)
+    if j < 48:
+        return (x | ~y) ^ z
+    if j < 64:
+        return (x & z) | (y & ~z)
+    return x ^ (y | ~z)
+
+
+def _ripemd160(data: bytes) -> bytes:
+    """Pure Python RIPEMD-160, used only where hashlib lacks it."""
+    mask = 0xFFFFFFFF
+
+    def rol(x: int, n: int) -> int:
+        x &= mask
+        return ((x << n) | (x >> (32 - n))) & mask
+
+    h = [0x67452301, 0xEFCDAB89, 0x98BADCFE, 0x10325476, 0xC3D2E1F0]
+    padded = data + b"\x80" + b"\x00" * ((55 - len(data)) % 64)
+    padded += struct.pack("<Q", len(data) * 8)
+    for offset in range(0, len(padded), 64):
+        x = struct.unpack("<16I", padded[offset : offset + 64])
+        a, b, c, d, e = h
+        a2, b2, c2, d2, e2 = h
+        for j in range(80):
+            r = j // 16
+            tmp = rol(a + _rmd_f(j, b, c, d) + x[_RMD_R[j]] + _RMD_K[r], _RMD_S[j])
+            a, e, d, c, b = e, d, rol(c, 10), b, (tmp + e) & mask
+            tmp = rol(
+                a2 + _rmd_f(79 - j, b2, c2, d2) + x[_RMD_R2[j]] + _RMD_K2[r],
+                _RMD_S2[j],
+            )
+            a2, e2, d2, c2, b2 = e2, d2, rol(c2, 10), b2, (tmp + e2) & mask
+        h = [
+            (h[1] + c + d2) & mask,
+            (h[2] + d + e2) & mask,
+            (h[3] + e + a2) & mask,
+            (h[4] + a + b2) & mask,
+            (h[0] + b + c2) & mask,
+        ]
+    return struct.pack("<5I", *h)
+
+
+def parse_path(path: str) -> tuple[int, ...]:
+    """Parse a derivation path like "m/44'/0'/0'/0/1" into child numbers.
+
+    Hardened indexes are marked with ', h or H. The leading "m" is optional.
+    """
+    parts = path.strip().split("/")
+    if parts[0] in ("m", "M", ""):
+        parts = parts[1:]
+    result = []
+    for part in parts:
+        hardened = part[-1:] in ("'", "h", "H")
+        number = part[:-1] if hardened else part
+        if not number.isdigit() or int(number) >= HARDENED:
+            raise ValueError(f"Invalid path component {part!r}")
+        result.append(int(number) + (HARDENED if hardened else 0))
+    return tuple(result)
+
+
+class ExtendedKey(object):
+    """A BIP32 node: a private or public key together with its chain code.
+
+    Nodes derived with `derive` are kept in a bounded LRU cache on the node they
+    were derived from, so sweeping many paths below a common parent computes each
+    shared ancestor only once.
+    """
+
+    def __init__(
+        self,
+        chain_code: bytes,
+        private_key: bytes | None = None,
+        public_key: bytes | None = None,
+        depth: int = 0,
+        parent_fingerprint: bytes = b"\x00\x00\x00\x00",
+        child_number: int = 0,
+        testnet: bool = False,
+        cache_size: int = 1024,
+    ):
+        if private_key is None and public_key is None:
+            raise ValueError("Either a private or a public key is required")
+        if private_key is not None:
+            k = int.from_bytes(private_key, "big")
+            if len(private_key) != 32 or not 0 < k < _N:
+                raise ValueError("Invalid private key")
+        if public_key is not None:
+            _parse_point(public_key)
+        if len(chain_code) != 32:
+            raise ValueError("Chain code should have length of 32")
+        self.chain_code = bytes(chain_code)
+        self.private_key = private_key
+        self._public_key = public_key
+        self.depth = depth
+        self.parent_fingerprint = parent_fingerprint
+        self.child_number = child_number
+        self.testnet = testnet
+        self.cache_size = cache_size
+        self._cache: collections.OrderedDict[
+            tuple[int, ...], ExtendedKey
+        ] = collections.OrderedDict()
+        self._cache_lock = threading.Lock()
+
+    @classmethod
+    def from_seed(cls, seed: bytes, testnet: bool = False) -> ExtendedKey:
+        """Create the master node from a BIP39 seed, see `Mnemonic.to_seed`."""
+        i = hmac.new(b"Bitcoin seed", seed, digestmod=hashlib.sha512).digest()
+        return cls(i[32:], private_key=i[:32], testnet=testnet)
+
+    @classmethod
+    def parse(cls, key: str) -> ExtendedKey:
+        """Parse a serialized xprv or xpub, e.g. from `Mnemonic.to_hd_master_key`."""
+        data = b58decode_check(key)
+        if len(data) != 78:
+            raise ValueError("Extended key should have length of 78")
+        version = data[:4]
+        if version in MAINNET:
+            testnet = False
+        elif version in TESTNET:
+            testnet = True
+        else:
+            raise ValueError("Unknown extended key version")
+        private = version in (MAINNET[0], TESTNET[0])
+        if private and data[45] != 0:
+            raise ValueError("Invalid private key prefix")
+        return cls(
+            data[13:45],
+            private_key=data[46:] if private else None,
+            public_key=None if private else data[45:],
+            depth=data[4],
+            parent_fingerprint=data[5:9],
+            child_number=int.from_bytes(data[9:13], "big"),
+            testnet=testnet,
+        )
+
+    @property
+    def public_key(self) -> bytes:
+        """Compressed SEC1 public key."""
+        if self._public_key is None:
+            assert self.private_key is not None
+            k = int.from_bytes(self.private_key, "big")
+            self._public_key = _serialize_point(_multiply_g(k))
+        return self._public_key
+
+    @property
+    def fingerprint(self) -> bytes:
+        return _hash160(self.public_key)[:4]
+
+    def neuter(self) -> ExtendedKey:
+        """Return the public-only counterpart of this node."""
+        return ExtendedKey(
+            self.chain_code,
+            public_key=self.public_key,
+            depth=self.depth,
+            parent_fingerprint=self.parent_fingerprint,
+            child_number=self.child_number,
+            testnet=self.testnet,
+            cache_size=self.cache_size,
+        )
+
+    def child(self, index: int) -> ExtendedKey:
+        """Derive the direct child `index`, hardened if index >= HARDENED."""
+        if not 0 <= index <= 0xFFFFFFFF:
+            raise ValueError("Child index out of range")
+        if index >= HARDENED:
+            if self.private_key is None:
+                raise ValueError("Cannot derive a hardened child from a public key")
+            data = b"\x00" + self.private_key
+        else:
+            data = self.public_key
+        i = hmac.new(
+            self.chain_code, data + index.to_bytes(4, "big"), hashlib.sha512
+        ).digest()
+        il = int.from_bytes(i[:32], "big")
+        if il >= _N:
+            raise ValueError("Invalid child, proceed with the next index")
+        private_key = public_key = None
+        if self.private_key is not None:
+            k = (il + int.from_bytes(self.private_key, "big")) % _N
+            if not k:
+                raise ValueError("Invalid child, proceed with the next index")
+            private_key = k.to_bytes(32, "big")
+        else:
+            p = _add((*_multiply_g(il), 1), _parse_point(self.public_key))
+            public_key = _serialize_point(_to_affine(p))
+        return ExtendedKey(
+            i[32:],
+            private_key=private_key,
+            public_key=public_key,
+            depth=self.depth + 1,
+            parent_fingerprint=self.fingerprint,
+            child_number=index,
+            testnet=self.testnet,
+            cache_size=self.cache_size,
+        )
+
+    def derive(self, path: str | t.Sequence[int]) -> ExtendedKey:
+        """Derive the node at `path` relative to this one, e.g. "m/44'/0'/0'/0/5".
+
+        Every node on the way is cached, so consecutive calls sharing a prefix
+        only derive the part that differs.
+        """
+        indexes = parse_path(path) if isinstance(path, str) else tuple(path)
+        node = self
+        start = 0
+        with self._cache_lock:
+            # resume from the deepest cached ancestor
+            for end in range(len(indexes), 0, -1):
+                cached = self._cache.get(indexes[:end])
+                if cached is not None:
+                    self._cache.move_to_end(indexes[:end])
+                    node, start = cached, end
+                    break
+        for end in range(start + 1, len(indexes) + 1):
+            node = node.child(indexes[end - 1])
+            if self.cache_size > 0:
+                with self._cache_lock:
+                    self._cache[indexes[:end]] = node
+                    while len(self._cache) > self.cache_size:
+                        self._cache.popitem(last=False)
+        return node
+
+    def to_xprv(self) -> str:
+        if self.private_key is None:
+            raise ValueError("Public-only node has no xprv")
+        return self._serialize(b"\x00" + self.private_key, private=True)
+
+    def to_xpub(self) -> str:
+        return self._serialize(self.public_key, private=False)
+
+    def _serialize(self, key: bytes, private: bool) -> str:
+        versions = TESTNET if self.testnet else MAINNET
+        return b58encode_check(
+            versions[0 if private else 1]
+            + bytes([self.depth])
+            + self.parent_fingerprint
+            + self.child_number.to_bytes(4, "big")
+            + self.chain_code
+            + key
+        )
+
+    def __str__(self) -> str:
+        return self.to_xprv() if self.private_key is not None else self.to_xpub()
@@ -0,0 +1,89 @@
+"""Bounded in-memory cache of derived BIP39 seeds."""
+from __future__ import annotations
+
+import collections
+import hashlib
+import hmac
+import secrets
+import threading
+import time
+import typing as t
+
+from .mnemonic import Mnemonic
+
+
+class SeedCache(object):
+    """LRU cache of `Mnemonic.to_seed` results with an optional time to live.
+
+    Entries are keyed by a keyed hash (HMAC with a random per-cache key) of the
+    normalized mnemonic and passphrase, so neither is retained. Cached seeds are
+    overwritten with zeros when they are evicted, expire or the cache is cleared.
+    Copies handed out to callers are not tracked and remain their responsibility.
+
+    The `hits`, `misses` and `evictions` counters help to size the cache.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 128,
+        ttl: float | None = 300.0,
+        clock: t.Callable[[], float] = time.monotonic,
+    ):
+        if maxsize < 1:
+            raise ValueError("Cache size must be at least 1.")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._clock = clock
+        self._key = secrets.token_bytes(32)
+        self._entries: collections.OrderedDict[
+            bytes, tuple[bytearray, float]
+        ] = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _digest(self, mnemonic: str, passphrase: str) -> bytes:
+        m = Mnemonic.normalize_string(mnemonic).encode("utf-8")
+        p = Mnemonic.normalize_string(passphrase).encode("utf-8")
+        data = len(m).to_bytes(4, "big") + m + p
+        return hmac.new(self._key, data, hashlib.sha256).digest()
+
+    def _evict(self, key: bytes) -> None:
+        seed, _ = self._entries.pop(key)
+        seed[:] = bytes(len(seed))
+        self.evictions += 1
+
+    def to_seed(self, mnemonic: str, passphrase: str = "") -> bytes:
+        """Return the seed from the cache, deriving and storing it on a miss."""
+        key = self._digest(mnemonic, passphrase)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[1] > self._clock():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return bytes(entry[0])
+                self._evict(key)
+            self.misses += 1
+        seed = Mnemonic.to_seed(mnemonic, passphrase)
+        expires = self._clock() + self.ttl if self.ttl is not None else float("inf")
+        with self._lock:
+            if key in self._entries:
+                self._evict(key)
+            now = self._clock()
+            for stale in [k for k, (_, e) in self._entries.items() if e <= now]:
+                self._evict(stale)
+            while len(self._entries) >= self.maxsize:
+                self._evict(next(iter(self._entries)))
+            self._entries[key] = (bytearray(seed), expires)
+        return seed
+
+    def clear(self) -> None:
+        """Zeroize and drop all cached seeds."""
+        with self._lock:
+            for key in list(self._entries):
+                self._evict(key)
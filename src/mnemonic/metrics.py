@@ -0,0 +1,112 @@
+"""Opt-in instrumentation of Mnemonic operations.
+
+Enable it process-wide by assigning an instance to `Mnemonic.metrics`:
+
+    Mnemonic.metrics = Metrics()
+
+While `Mnemonic.metrics` is None (the default) operations only pay for one
+attribute check.
+"""
+from __future__ import annotations
+
+import collections
+import threading
+import time
+import typing as t
+
+Listener = t.Callable[[str, float, t.Optional[str]], None]
+
+
+class _Measurement(object):
+    __slots__ = ("metrics", "operation", "reason", "start")
+
+    def __init__(self, metrics: Metrics, operation: str):
+        self.metrics = metrics
+        self.operation = operation
+        self.reason: str | None = None
+        self.start = 0.0
+
+    def fail(self, reason: str) -> None:
+        """Record the call as failed without an exception, e.g. `check` returning False."""
+        self.reason = reason
+
+    def __enter__(self) -> _Measurement:
+        self.start = self.metrics.clock()
+        return self
+
+    def __exit__(self, exc_type: t.Any, exc: BaseException | None, tb: t.Any) -> None:
+        seconds = self.metrics.clock() - self.start
+        if exc is not None:
+            self.reason = getattr(exc, "reason", type(exc).__name__)
+        self.metrics.record(self.operation, seconds, self.reason)
+
+
+class Metrics(object):
+    """Call counts, failure reasons and latencies of Mnemonic operations.
+
+    Failures are counted by reason, e.g. "length", "word" or "checksum" for
+    `to_entropy` and `check`. Every call is also passed to the `listeners` as
+    (operation, seconds, reason or None).
+    """
+
+    def __init__(
+        self,
+        listeners: t.Iterable[Listener] = (),
+        clock: t.Callable[[], float] = time.perf_counter,
+    ):
+        self.listeners = list(listeners)
+        self.clock = clock
+        self.calls: collections.Counter[str] = collections.Counter()
+        self.failures: collections.Counter[tuple[str, str]] = collections.Counter()
+        self.seconds: dict[str, float] = collections.defaultdict(float)
+        self._lock = threading.Lock()
+
+    def measure(self, operation: str) -> _Measurement:
+        """Context manager recording one call of `operation`."""
+        return _Measurement(self, operation)
+
+    def record(self, operation: str, seconds: float, reason: str | None = None) -> None:
+        with self._lock:
+            self.calls[operation] += 1
+            self.seconds[operation] += seconds
+            if reason is not None:
+                self.failures[operation, reason] += 1
+        for listener in self.listeners:
+            listener(operation, seconds, reason)
+
+    def reset(self) -> None:
+        with self._lock:
+            self.calls.clear()
+            self.failures.clear()
+            self.seconds.clear()
+
+    def to_prometheus(self, prefix: str = "mnemonic") -> str:
+        """Export the counters in the Prometheus text exposition format."""
+        with self._lock:
+            calls = sorted(self.calls.items())
+            failures = sorted(self.failures.items())
+            seconds = sorted(self.seconds.items())
+        lines = [
+            f"# HELP {prefix}_calls_total Calls of Mnemonic operations.",
+            f"# TYPE {prefix}_calls_total counter",
+        ]
+        lines += [f'{prefix}_calls_total{{operation="{o}"}} {n}' for o, n in calls]
+        lines += [
+            f"# HELP {prefix}_failures_total Failed calls by reason.",
+            f"# TYPE {prefix}_failures_total counter",
+        ]
+        lines += [
+            f'{prefix}_failures_total{{operation="{o}",reason="{r}"}} {n}'
+            for (o, r), n in failures
+        ]
+        lines += [
+            f"# HELP {prefix}_duration_seconds Time spent in Mnemonic operations.",
+            f"# TYPE {prefix}_duration_seconds summary",
+        ]
+        counts = dict(calls)
+        for o, s in seconds:
+            lines.append(f'{prefix}_duration_seconds_sum{{operation="{o}"}} {s!r}')
+            lines.append(
+                f'{prefix}_duration_seconds_count{{operation="{o}"}} {counts[o]}'
+            )
+        return "\n".join(lines) + "\n"
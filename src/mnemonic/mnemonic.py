@@ -21,64 +21,342 @@
 #
 from __future__ import annotations
 
+import array
+import asyncio
+import bisect
+import concurrent.futures
+import functools
 import hashlib
 import hmac
 import itertools
+import mmap
 import os
 import secrets
+import threading
 import typing as t
 import unicodedata
+import weakref
+
+from .base58 import b58encode  # noqa: F401 (kept importable from this module)
+from .base58 import b58encode_check
+from .metrics import Metrics
 
 PBKDF2_ROUNDS = 2048
 
+_async_lock = threading.Lock()
+_async_executor: concurrent.futures.Executor | None = None
+_async_limits: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, asyncio.Semaphore
+] = weakref.WeakKeyDictionary()
+
 
 class ConfigurationError(Exception):
     pass
 
 
-# Refactored code segments from <https://github.com/keis/base58>
-def b58encode(v: bytes) -> str:
-    alphabet = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+_E = t.TypeVar("_E", bound=BaseException)
+
+# Buffers that entropy is read from, and results are written to, without copies
+Buffer = t.Union[bytes, bytearray, memoryview, array.array, mmap.mmap]
+WritableBuffer = t.Union[bytearray, memoryview, array.array, mmap.mmap]
+
+
+def _failure(exc: _E, reason: str) -> _E:
+    """Tag `exc` with the failure reason recorded by `Mnemonic.metrics`."""
+    exc.reason = reason  # type: ignore[attr-defined]
+    return exc
+
+
+def _encode(data: bytes | memoryview) -> list[int]:
+    """Split entropy and its checksum into 11-bit wordlist indexes."""
+    checksum_bits = len(data) // 4
+    checksum = hashlib.sha256(data).digest()[0] >> (8 - checksum_bits)
+    acc = (int.from_bytes(data, byteorder="big") << checksum_bits) | checksum
+    count = (len(data) * 8 + checksum_bits) // 11
+    return [(acc >> (11 * i)) & 0x7FF for i in range(count - 1, -1, -1)]
+
+
+def _decode(indexes: list[int]) -> tuple[bytes, bool]:
+    """Join 11-bit wordlist indexes back into entropy.
+
+    Returns the entropy together with the result of the checksum verification.
+    """
+    acc = 0
+    for ndx in indexes:
+        acc = (acc << 11) | ndx
+    checksum_bits = len(indexes) * 11 // 33
+    entropy = (acc >> checksum_bits).to_bytes(checksum_bits * 4, byteorder="big")
+    checksum = hashlib.sha256(entropy).digest()[0] >> (8 - checksum_bits)
+    return entropy, checksum == acc & ((1 << checksum_bits) - 1)
+
+
+def _byte_view(data: Buffer) -> bytes | memoryview:
+    """Return `data`, or a flat byte view of any other buffer, without copying."""
+    if isinstance(data, bytes):
+        return data
+    return memoryview(data).cast("B")
+
+
+def _entropy_view(data: Buffer) -> bytes | memoryview:
+    """Return `data` as bytes or a byte view, checking that it is valid entropy."""
+    view = _byte_view(data)
+    if len(view) not in (16, 20, 24, 28, 32):
+        raise ValueError(
+            f"Data length should be one of the following: [16, 20, 24, 28, 32], but it is not {len(view)}."
+        )
+    return view
+
+
+def _writable_view(out: WritableBuffer, size: int) -> memoryview:
+    """Return a writable view of the first `size` bytes of the buffer `out`."""
+    view = memoryview(out).cast("B")
+    if view.readonly:
+        raise TypeError("Output buffer is read-only.")
+    if len(view) < size:
+        raise ValueError(
+            f"Output buffer of {len(view)} bytes is too small, {size} bytes are needed."
+        )
+    return view[:size]
+
+
+def _split_records(data: Buffer, width: int | None) -> list[memoryview]:
+    """Slice a contiguous buffer into fixed-width records without copying."""
+    if not width or width < 0:
+        raise ValueError("Record width must be a positive number of bytes.")
+    view = memoryview(data).cast("B")
+    if len(view) % width:
+        raise ValueError(
+            f"Buffer length {len(view)} is not a multiple of record width {width}."
+        )
+    return [view[i : i + width] for i in range(0, len(view), width)]
+
+
+def _default_async_executor() -> concurrent.futures.Executor:
+    global _async_executor
+    with _async_lock:
+        if _async_executor is None:
+            _async_executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=os.cpu_count() or 1, thread_name_prefix="mnemonic"
+            )
+        return _async_executor
+
+
+def _default_async_limit(loop: asyncio.AbstractEventLoop) -> asyncio.Semaphore:
+    limit = _async_limits.get(loop)
+    if limit is None:
+        limit = _async_limits[loop] = asyncio.Semaphore(os.cpu_count() or 1)
+    return limit
+
+
+async def _run_bounded(
+    executor: concurrent.futures.Executor | None,
+    limit: asyncio.Semaphore | None,
+    func: t.Callable[..., t.Any],
+    *args: t.Any,
+) -> t.Any:
+    """Run `func` in `executor` while holding a slot of `limit`.
+
+    The slot is held until the worker is actually done, so cancelling the awaiting
+    task does not let more work pile up in the executor than `limit` allows.
+    """
+    loop = asyncio.get_running_loop()
+    if executor is None:
+        executor = _default_async_executor()
+    if limit is None:
+        limit = _default_async_limit(loop)
+
+    def release(_: concurrent.futures.Future) -> None:
+        try:
+            loop.call_soon_threadsafe(limit.release)
+        except RuntimeError:  # event loop already closed
+            pass
+
+    await limit.acquire()
+    try:
+        future = executor.submit(func, *args)
+    except BaseException:
+        limit.release()
+        raise
+    future.add_done_callback(release)
+    return await asyncio.wrap_future(future)
+
+
+class Wordlist(t.Sequence[str]):
+    """Immutable list of words with a reverse index from word to position."""
+
+    __slots__ = ("_words", "_index", "_sorted", "_aliases")
+
+    def __init__(self, words: t.Iterable[str]):
+        self._words = tuple(words)
+        # Reverse lookup table, word -> position in the wordlist
+        self._index = {word: i for i, word in enumerate(self._words)}
+        # Words in code point order for prefix searches, built on first use
+        self._sorted: tuple[str, ...] | None = None
+        # Composed (NFC) spellings of words, which is how most input methods
+        # produce accented, hangul or kana text
+        self._aliases: dict[str, int] = {}
+        for i, word in enumerate(self._words):
+            if not word.isascii():
+                alias = unicodedata.normalize("NFC", word)
+                if alias != word:
+                    self._aliases[alias] = i
+
+    @t.overload
+    def __getitem__(self, i: int) -> str:
+        ...
+
+    @t.overload
+    def __getitem__(self, i: slice) -> tuple[str, ...]:
+        ...
+
+    def __getitem__(self, i: int | slice) -> str | tuple[str, ...]:
+        return self._words[i]
 
-    p, acc = 1, 0
-    for c in reversed(v):
-        acc += p * c
-        p = p << 8
+    def __len__(self) -> int:
+        return len(self._words)
 
-    string = ""
-    while acc:
-        acc, idx = divmod(acc, 58)
-        string = alphabet[idx : idx + 1] + string
-    return string
+    def __iter__(self) -> t.Iterator[str]:
+        return iter(self._words)
+
+    def __contains__(self, word: object) -> bool:
+        return word in self._index
+
+    def __repr__(self) -> str:
+        return f"Wordlist({list(self._words)!r})"
+
+    def __eq__(self, other: object) -> bool:
+        # compares equal to a list or tuple of the same words, like the list
+        # that `Mnemonic.wordlist` used to be
+        if isinstance(other, Wordlist):
+            return self._words == other._words
+        if isinstance(other, (list, tuple)):
+            return list(self._words) == list(other)
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self._words)
+
+    def index(self, word: str, start: int = 0, stop: int | None = None) -> int:
+        i = self._index.get(word, -1)
+        start, stop, _ = slice(start, stop).indices(len(self._words))
+        if i < 0 or not start <= i < stop:
+            raise ValueError(f"{word!r} is not in wordlist")
+        return i
+
+    def _resolve(self, word: str) -> int:
+        """Return the position of `word` in any normalization form, or -1."""
+        i = self._index.get(word)
+        if i is None:
+            i = self._aliases.get(word)
+            if i is None:
+                i = self._index.get(Mnemonic.normalize_string(word), -1)
+        return i
+
+    def completions(self, prefix: str, limit: int | None = None) -> list[str]:
+        """Return the words starting with `prefix` in sorted order, at most `limit`."""
+        words = self._sorted
+        if words is None:
+            words = self._sorted = tuple(sorted(self._words))
+        result: list[str] = []
+        for i in range(bisect.bisect_left(words, prefix), len(words)):
+            if not words[i].startswith(prefix) or len(result) == limit:
+                break
+            result.append(words[i])
+        return result
+
+    def is_prefix(self, prefix: str) -> bool:
+        """Return True if some word starts with `prefix`."""
+        return bool(self.completions(prefix, 1))
+
+
+_WORDLIST_DIR = os.path.join(os.path.dirname(__file__), "wordlist")
+_wordlists: dict[str, Wordlist] = {}
+_wordlists_lock = threading.Lock()
+
+
+def _builtin_wordlist(language: str) -> Wordlist:
+    """Return the bundled wordlist for `language`, loading it on first use.
+
+    Loaded wordlists are cached for the lifetime of the process and shared by all
+    Mnemonic instances of that language.
+    """
+    wordlist = _wordlists.get(language)
+    if wordlist is not None:
+        return wordlist
+    with _wordlists_lock:
+        wordlist = _wordlists.get(language)
+        if wordlist is None:
+            d = os.path.join(_WORDLIST_DIR, f"{language}.txt")
+            if not (os.path.exists(d) and os.path.isfile(d)):
+                raise ConfigurationError("Language not detected")
+            with open(d, "r", encoding="utf-8") as f:
+                wordlist = Wordlist(
+                    Mnemonic.normalize_string(w.strip()) for w in f.readlines()
+                )
+            _wordlists[language] = wordlist
+        return wordlist
+
+
+@functools.lru_cache(maxsize=None)
+def _builtin_languages() -> tuple[str, ...]:
+    return tuple(
+        f.split(".")[0] for f in os.listdir(_WORDLIST_DIR) if f.endswith(".txt")
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _language_index(
+    languages: tuple[str, ...]
+) -> tuple[dict[str, int], dict[str, int]]:
+    """Map every word prefix and every word to a bitmask of `languages`.
+
+    Bit `i` of a mask is set when the word (prefix) belongs to `languages[i]`.
+    """
+    prefixes: dict[str, int] = {}
+    words: dict[str, int] = {}
+    for i, language in enumerate(languages):
+        bit = 1 << i
+        for word in _builtin_wordlist(language):
+            words[word] = words.get(word, 0) | bit
+            for end in range(1, len(word) + 1):
+                prefix = word[:end]
+                prefixes[prefix] = prefixes.get(prefix, 0) | bit
+    return prefixes, words
 
 
 class Mnemonic(object):
-    def __init__(self, language: str = "english", wordlist: list[str] | None = None):
+    __slots__ = ("radix", "language", "delimiter", "_wordlist", "_index")
+
+    # Instrumentation of the hot paths, disabled while None, see `Metrics`
+    metrics: t.ClassVar[Metrics | None] = None
+
+    def __init__(
+        self, language: str = "english", wordlist: t.Sequence[str] | None = None
+    ):
         self.radix = 2048
         self.language = language
 
         if wordlist is None:
-            d = os.path.join(os.path.dirname(__file__), f"wordlist/{language}.txt")
-            if os.path.exists(d) and os.path.isfile(d):
-                with open(d, "r", encoding="utf-8") as f:
-                    wordlist = [w.strip() for w in f.readlines()]
-            else:
-                raise ConfigurationError("Language not detected")
+            wordlist = _builtin_wordlist(language)
+        elif not isinstance(wordlist, Wordlist):
+            wordlist = Wordlist(wordlist)
 
         if len(wordlist) != self.radix:
             raise ConfigurationError(f"Wordlist must contain {self.radix} words.")
 
-        self.wordlist = wordlist
+        self._wordlist = wordlist
+        self._index = wordlist._index
         # Japanese must be joined by ideographic space
         self.delimiter = "\u3000" if language == "japanese" else " "
 
+    @property
+    def wordlist(self) -> Wordlist:
+        """Read-only view of the words, shared by instances of the same language."""
+        return self._wordlist
+
     @classmethod
     def list_languages(cls) -> list[str]:
-        return [
-            f.split(".")[0]
-            for f in os.listdir(os.path.join(os.path.dirname(__file__), "wordlist"))
-            if f.endswith(".txt")
-        ]
+        return list(_builtin_languages())
 
     @staticmethod
     def normalize_string(txt: t.AnyStr) -> str:
@@ -89,6 +367,9 @@ class Mnemonic(object):
         else:
             raise TypeError("String value expected")
 
+        if utxt.isascii():
+            # ASCII text is invariant under normalization
+            return utxt
         return unicodedata.normalize("NFKD", utxt)
 
     @classmethod
@@ -103,28 +384,44 @@ class Mnemonic(object):
 
         If prefixes remain ambiguous, require exactly one language where word(s) match exactly.
         """
+        if cls.metrics is None:
+            return cls._detect_language(code)
+        with cls.metrics.measure("detect_language"):
+            return cls._detect_language(code)
+
+    @classmethod
+    def _detect_language(cls, code: str) -> str:
         code = cls.normalize_string(code)
-        possible = set(cls(lang) for lang in cls.list_languages())
+        languages = tuple(cls.list_languages())
+        prefixes, exact = _language_index(languages)
+        possible = (1 << len(languages)) - 1
         words = set(code.split())
         for word in words:
             # possible languages have candidate(s) starting with the word/prefix
-            possible = set(
-                p for p in possible if any(c.startswith(word) for c in p.wordlist)
-            )
+            possible &= prefixes.get(word, 0)
             if not possible:
-                raise ConfigurationError(f"Language unrecognized for {word!r}")
-        if len(possible) == 1:
-            return possible.pop().language
+                raise _failure(
+                    ConfigurationError(f"Language unrecognized for {word!r}"),
+                    "unrecognized",
+                )
+        if possible & (possible - 1) == 0:
+            return languages[possible.bit_length() - 1]
         # Multiple languages match: A prefix in many, but an exact match in one determines language.
-        complete = set()
+        complete = 0
         for word in words:
-            exact = set(p for p in possible if word in p.wordlist)
-            if len(exact) == 1:
-                complete.update(exact)
-        if len(complete) == 1:
-            return complete.pop().language
-        raise ConfigurationError(
-            f"Language ambiguous between {', '.join(p.language for p in possible)}"
+            matches = exact.get(word, 0) & possible
+            if matches and matches & (matches - 1) == 0:
+                complete |= matches
+        if complete and complete & (complete - 1) == 0:
+            return languages[complete.bit_length() - 1]
+        raise _failure(
+            ConfigurationError(
+                "Language ambiguous between %s"
+                % ", ".join(
+                    lang for i, lang in enumerate(languages) if possible >> i & 1
+                )
+            ),
+            "ambiguous",
         )
 
     def generate(self, strength: int = 128) -> str:
@@ -149,90 +446,291 @@ class Mnemonic(object):
             )
         return self.to_mnemonic(secrets.token_bytes(strength // 8))
 
-    # Adapted from <http://tinyurl.com/oxmn476>
-    def to_entropy(self, words: list[str] | str) -> bytearray:
+    @t.overload
+    def generate_stream(
+        self,
+        count: int,
+        strength: int = ...,
+        with_seed: t.Literal[False] = ...,
+        passphrase: str = ...,
+        block_size: int = ...,
+    ) -> t.Iterator[str]:
+        ...
+
+    @t.overload
+    def generate_stream(
+        self,
+        count: int,
+        strength: int = ...,
+        *,
+        with_seed: t.Literal[True],
+        passphrase: str = ...,
+        block_size: int = ...,
+    ) -> t.Iterator[tuple[bytes, str, bytes]]:
+        ...
+
+    def generate_stream(
+        self,
+        count: int,
+        strength: int = 128,
+        with_seed: bool = False,
+        passphrase: str = "",
+        block_size: int = 65536,
+    ) -> t.Iterator[str] | t.Iterator[tuple[bytes, str, bytes]]:
+        """
+        Lazily generate `count` random mnemonics, see `generate`.
+
+        Entropy is drawn from the OS in blocks of about `block_size` bytes and
+        sliced into mnemonics, so memory use does not grow with `count`.
+
+        If `with_seed` is set, (entropy, mnemonic, seed) tuples are produced
+        instead, with the seed derived using `passphrase`.
+        """
+        if strength not in [128, 160, 192, 224, 256]:
+            raise ValueError(
+                "Invalid strength value. Allowed values are [128, 160, 192, 224, 256]."
+            )
+        if count < 0:
+            raise ValueError("Count must not be negative.")
+        return self._generate_stream(
+            count, strength // 8, with_seed, passphrase, block_size
+        )
+
+    def _generate_stream(
+        self,
+        count: int,
+        width: int,
+        with_seed: bool,
+        passphrase: str,
+        block_size: int,
+    ) -> t.Iterator[t.Any]:
+        per_block = max(block_size // width, 1)
+        wordlist = self.wordlist
+        delimiter = self.delimiter
+        while count > 0:
+            n = min(count, per_block)
+            block = secrets.token_bytes(n * width)
+            count -= n
+            for offset in range(0, n * width, width):
+                data = block[offset : offset + width]
+                code = delimiter.join([wordlist[i] for i in _encode(data)])
+                if with_seed:
+                    yield data, code, self.to_seed(code, passphrase)
+                else:
+                    yield code
+
+    @t.overload
+    def to_entropy(self, words: list[str] | str, *, out: None = ...) -> bytes:
+        ...
+
+    @t.overload
+    def to_entropy(self, words: list[str] | str, *, out: WritableBuffer) -> memoryview:
+        ...
+
+    def to_entropy(
+        self, words: list[str] | str, *, out: WritableBuffer | None = None
+    ) -> bytes | memoryview:
+        """
+        Convert a mnemonic back to its entropy.
+
+        If `out` is given, the entropy is written to the start of that writable
+        buffer and a view of the written bytes is returned.
+        """
+        if self.metrics is None:
+            return self._to_entropy(words, out)
+        with self.metrics.measure("to_entropy"):
+            return self._to_entropy(words, out)
+
+    def _to_entropy(
+        self, words: list[str] | str, out: WritableBuffer | None
+    ) -> bytes | memoryview:
         if not isinstance(words, list):
             words = words.split(" ")
         if len(words) not in [12, 15, 18, 21, 24]:
-            raise ValueError(
-                "Number of words must be one of the following: [12, 15, 18, 21, 24], but it is not (%d)."
-                % len(words)
+            raise _failure(
+                ValueError(
+                    "Number of words must be one of the following: [12, 15, 18, 21, 24], but it is not (%d)."
+                    % len(words)
+                ),
+                "length",
             )
-        # Look up all the words in the list and construct the
-        # concatenation of the original entropy and the checksum.
-        concatLenBits = len(words) * 11
-        concatBits = [False] * concatLenBits
-        wordindex = 0
+        indexes = []
+        resolve = self.wordlist._resolve
         for word in words:
             # Find the words index in the wordlist
-            ndx = self.wordlist.index(self.normalize_string(word))
+            ndx = resolve(word)
             if ndx < 0:
-                raise LookupError('Unable to find "%s" in word list.' % word)
-            # Set the next 11 bits to the value of the index.
-            for ii in range(11):
-                concatBits[(wordindex * 11) + ii] = (ndx & (1 << (10 - ii))) != 0
-            wordindex += 1
-        checksumLengthBits = concatLenBits // 33
-        entropyLengthBits = concatLenBits - checksumLengthBits
-        # Extract original entropy as bytes.
-        entropy = bytearray(entropyLengthBits // 8)
-        for ii in range(len(entropy)):
-            for jj in range(8):
-                if concatBits[(ii * 8) + jj]:
-                    entropy[ii] |= 1 << (7 - jj)
-        # Take the digest of the entropy.
-        hashBytes = hashlib.sha256(entropy).digest()
-        hashBits = list(
-            itertools.chain.from_iterable(
-                [c & (1 << (7 - i)) != 0 for i in range(8)] for c in hashBytes
-            )
-        )
-        # Check all the checksum bits.
-        for i in range(checksumLengthBits):
-            if concatBits[entropyLengthBits + i] != hashBits[i]:
-                raise ValueError("Failed checksum.")
-        return entropy
-
-    def to_mnemonic(self, data: bytes) -> str:
-        if len(data) not in [16, 20, 24, 28, 32]:
-            raise ValueError(
-                f"Data length should be one of the following: [16, 20, 24, 28, 32], but it is not {len(data)}."
-            )
-        h = hashlib.sha256(data).hexdigest()
-        b = (
-            bin(int.from_bytes(data, byteorder="big"))[2:].zfill(len(data) * 8)
-            + bin(int(h, 16))[2:].zfill(256)[: len(data) * 8 // 32]
-        )
-        result = []
-        for i in range(len(b) // 11):
-            idx = int(b[i * 11 : (i + 1) * 11], 2)
-            result.append(self.wordlist[idx])
-        return self.delimiter.join(result)
+                raise _failure(
+                    ValueError('Unable to find "%s" in word list.' % word), "word"
+                )
+            indexes.append(ndx)
+        entropy, valid = _decode(indexes)
+        if not valid:
+            raise _failure(ValueError("Failed checksum."), "checksum")
+        if out is None:
+            return entropy
+        view = _writable_view(out, len(entropy))
+        view[:] = entropy
+        return view
+
+    def to_mnemonic(self, data: Buffer) -> str:
+        """Convert entropy, any bytes-like object, to a mnemonic."""
+        wordlist = self.wordlist
+        return self.delimiter.join([wordlist[i] for i in _encode(_entropy_view(data))])
 
     def check(self, mnemonic: str) -> bool:
+        if self.metrics is None:
+            return self._check(mnemonic) is None
+        with self.metrics.measure("check") as measurement:
+            reason = self._check(mnemonic)
+            if reason is not None:
+                measurement.fail(reason)
+            return reason is None
+
+    def _check(self, mnemonic: str) -> str | None:
+        """Return the reason why `mnemonic` is invalid, or None if it is valid."""
         mnemonic_list = self.normalize_string(mnemonic).split(" ")
         # list of valid mnemonic lengths
         if len(mnemonic_list) not in [12, 15, 18, 21, 24]:
-            return False
+            return "length"
         try:
-            idx = map(
-                lambda x: bin(self.wordlist.index(x))[2:].zfill(11), mnemonic_list
-            )
-            b = "".join(idx)
-        except ValueError:
-            return False
-        l = len(b)  # noqa: E741
-        d = b[: l // 33 * 32]
-        h = b[-l // 33 :]
-        nd = int(d, 2).to_bytes(l // 33 * 4, byteorder="big")
-        nh = bin(int(hashlib.sha256(nd).hexdigest(), 16))[2:].zfill(256)[: l // 33]
-        return h == nh
+            indexes = [self._index[x] for x in mnemonic_list]
+        except KeyError:
+            return "word"
+        return None if _decode(indexes)[1] else "checksum"
+
+    def to_mnemonic_many(
+        self,
+        data: t.Iterable[Buffer] | Buffer,
+        width: int | None = None,
+        errors: dict[int, Exception] | None = None,
+    ) -> list[str | None]:
+        """
+        Convert many entropies to mnemonics in one call.
+
+        `data` is either an iterable of entropies, or a single contiguous buffer
+        holding entropies of `width` bytes each.
+
+        Invalid entropies do not abort the batch: their result is None, and the
+        exception is stored under their position in `errors` if it is provided.
+        """
+        records = t.cast(t.Iterable[Buffer], data)
+        if not isinstance(data, (list, tuple)):
+            try:
+                buffer = memoryview(t.cast(Buffer, data))
+            except TypeError:  # not a buffer, but an iterable of entropies
+                pass
+            else:
+                records = _split_records(buffer, width)
+        wordlist = self.wordlist
+        delimiter = self.delimiter
+        result: list[str | None] = []
+        for i, d in enumerate(records):
+            try:
+                view = _entropy_view(d)
+            except (TypeError, ValueError) as e:
+                if errors is not None:
+                    errors[i] = e
+                result.append(None)
+                continue
+            result.append(delimiter.join([wordlist[x] for x in _encode(view)]))
+        return result
+
+    @t.overload
+    def to_entropy_many(
+        self,
+        mnemonics: t.Iterable[list[str] | str],
+        errors: dict[int, Exception] | None = ...,
+        out: None = ...,
+        width: int | None = ...,
+    ) -> list[bytes | None]:
+        ...
+
+    @t.overload
+    def to_entropy_many(
+        self,
+        mnemonics: t.Iterable[list[str] | str],
+        errors: dict[int, Exception] | None = ...,
+        *,
+        out: WritableBuffer,
+        width: int,
+    ) -> list[memoryview | None]:
+        ...
+
+    def to_entropy_many(
+        self,
+        mnemonics: t.Iterable[list[str] | str],
+        errors: dict[int, Exception] | None = None,
+        out: WritableBuffer | None = None,
+        width: int | None = None,
+    ) -> list[bytes | None] | list[memoryview | None]:
+        """
+        Convert many mnemonics back to entropy in one call.
+
+        Invalid mnemonics do not abort the batch: their result is None, and the
+        exception is stored under their position in `errors` if it is provided.
+
+        If `out` is given, it is a writable buffer of consecutive records of
+        `width` bytes, and the entropy of the mnemonic at position i is written
+        to record i. Views of the records are returned instead of bytes; an
+        entropy of another length counts as invalid. A read-only or too small
+        buffer is rejected before anything is written.
+        """
+        records: list[memoryview] | None = None
+        if out is not None:
+            mnemonics = list(mnemonics)
+            size = (width or 0) * len(mnemonics)
+            records = _split_records(_writable_view(out, size), width)
+        result: list[t.Any] = []
+        for i, words in enumerate(mnemonics):
+            try:
+                entropy = self.to_entropy(words)
+                if records is None:
+                    result.append(entropy)
+                    continue
+                if len(entropy) != width:
+                    raise ValueError(
+                        f"Entropy length {len(entropy)} does not match record width {width}."
+                    )
+                record = records[i]
+                record[:] = entropy
+                result.append(record)
+            except (TypeError, AttributeError, ValueError) as e:
+                if errors is not None:
+                    errors[i] = e
+                result.append(None)
+        return result
+
+    def check_many(
+        self,
+        mnemonics: t.Iterable[str],
+        errors: dict[int, Exception] | None = None,
+    ) -> list[bool]:
+        """
+        Validate many mnemonics in one call, see `check`.
+
+        Items that are not strings are invalid; the exception is stored under
+        their position in `errors` if it is provided.
+        """
+        result = []
+        for i, mnemonic in enumerate(mnemonics):
+            try:
+                result.append(self._check(mnemonic) is None)
+            except TypeError as e:
+                if errors is not None:
+                    errors[i] = e
+                result.append(False)
+        return result
+
+    def autocomplete(self, prefix: str, limit: int | None = None) -> list[str]:
+        """Return the words starting with `prefix` in sorted order, at most `limit`."""
+        return self.wordlist.completions(prefix, limit)
 
     def expand_word(self, prefix: str) -> str:
-        if prefix in self.wordlist:
+        if prefix in self._index:
             return prefix
         else:
-            matches = [word for word in self.wordlist if word.startswith(prefix)]
+            matches = self.wordlist.completions(prefix, 2)
             if len(matches) == 1:  # matched exactly one word in the wordlist
                 return matches[0]
             else:
@@ -243,22 +741,169 @@ class Mnemonic(object):
     def expand(self, mnemonic: str) -> str:
         return " ".join(map(self.expand_word, mnemonic.split(" ")))
 
+    @t.overload
+    @classmethod
+    def to_seed(cls, mnemonic: str, passphrase: str = ..., *, out: None = ...) -> bytes:
+        ...
+
+    @t.overload
     @classmethod
-    def to_seed(cls, mnemonic: str, passphrase: str = "") -> bytes:
+    def to_seed(
+        cls, mnemonic: str, passphrase: str = ..., *, out: WritableBuffer
+    ) -> memoryview:
+        ...
+
+    @classmethod
+    def to_seed(
+        cls, mnemonic: str, passphrase: str = "", *, out: WritableBuffer | None = None
+    ) -> bytes | memoryview:
+        """
+        Derive the 64 byte BIP39 seed of a mnemonic.
+
+        If `out` is given, the seed is written to the start of that writable
+        buffer and a view of the written bytes is returned.
+        """
+        if cls.metrics is None:
+            return cls._to_seed(mnemonic, passphrase, out)
+        with cls.metrics.measure("to_seed"):
+            return cls._to_seed(mnemonic, passphrase, out)
+
+    @classmethod
+    def _to_seed(
+        cls, mnemonic: str, passphrase: str = "", out: WritableBuffer | None = None
+    ) -> bytes | memoryview:
         mnemonic = cls.normalize_string(mnemonic)
         passphrase = cls.normalize_string(passphrase)
         passphrase = "mnemonic" + passphrase
         mnemonic_bytes = mnemonic.encode("utf-8")
         passphrase_bytes = passphrase.encode("utf-8")
-        stretched = hashlib.pbkdf2_hmac(
+        seed = hashlib.pbkdf2_hmac(
             "sha512", mnemonic_bytes, passphrase_bytes, PBKDF2_ROUNDS
         )
-        return stretched[:64]
+        if out is None:
+            return seed
+        view = _writable_view(out, len(seed))
+        view[:] = seed
+        return view
+
+    @t.overload
+    @classmethod
+    def to_seed_many(
+        cls,
+        mnemonics: t.Iterable[str],
+        passphrases: t.Iterable[str] | str = ...,
+        workers: int | None = ...,
+        processes: bool = ...,
+        chunksize: int = ...,
+        out: None = ...,
+    ) -> list[bytes]:
+        ...
+
+    @t.overload
+    @classmethod
+    def to_seed_many(
+        cls,
+        mnemonics: t.Iterable[str],
+        passphrases: t.Iterable[str] | str = ...,
+        workers: int | None = ...,
+        processes: bool = ...,
+        chunksize: int = ...,
+        *,
+        out: WritableBuffer,
+    ) -> list[memoryview]:
+        ...
+
+    @classmethod
+    def to_seed_many(
+        cls,
+        mnemonics: t.Iterable[str],
+        passphrases: t.Iterable[str] | str = "",
+        workers: int | None = None,
+        processes: bool = False,
+        chunksize: int = 1,
+        out: WritableBuffer | None = None,
+    ) -> list[bytes] | list[memoryview]:
+        """
+        Derive seeds for many mnemonics in parallel, keeping the input order.
+
+        `passphrases` is either a single passphrase used for every mnemonic, or an
+        iterable with exactly one passphrase per mnemonic.
+
+        The work is spread over `workers` threads (defaults to the CPU count);
+        PBKDF2 releases the GIL, so threads scale across cores. Set `processes`
+        to use a process pool instead, in which case `chunksize` mnemonics are
+        sent to a worker at a time.
+
+        If `out` is given, the seeds are written to that writable buffer as
+        consecutive 64 byte records and views of the records are returned. Threads
+        write directly to their record, results of processes are copied in.
+        """
+        mnemonics = list(mnemonics)
+        if isinstance(passphrases, str):
+            passphrases = [passphrases] * len(mnemonics)
+        else:
+            passphrases = list(passphrases)
+            if len(passphrases) != len(mnemonics):
+                raise ValueError(
+                    f"Got {len(passphrases)} passphrases for {len(mnemonics)} mnemonics."
+                )
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if workers < 1:
+            raise ValueError("Number of workers must be at least 1.")
+        derive: t.Callable[..., t.Any] = cls.to_seed
+        args: list[t.Iterable[t.Any]] = [mnemonics, passphrases]
+        records: list[memoryview] = []
+        if out is not None:
+            records = _split_records(_writable_view(out, 64 * len(mnemonics)), 64)
+            if not processes or workers == 1:
+                derive = lambda m, p, o: cls.to_seed(m, p, out=o)  # noqa: E731
+                args.append(records)
+        if workers == 1:
+            return list(map(derive, *args))
+        executor: concurrent.futures.Executor
+        if processes:
+            executor = concurrent.futures.ProcessPoolExecutor(max_workers=workers)
+        else:
+            executor = concurrent.futures.ThreadPoolExecutor(max_workers=workers)
+        with executor:
+            seeds = list(executor.map(derive, *args, chunksize=chunksize))
+        if out is not None and processes:
+            for record, seed in zip(records, seeds):
+                record[:] = seed
+            return records
+        return seeds
+
+    @classmethod
+    async def to_seed_async(
+        cls,
+        mnemonic: str,
+        passphrase: str = "",
+        executor: concurrent.futures.Executor | None = None,
+        limit: asyncio.Semaphore | None = None,
+    ) -> bytes:
+        """
+        Asynchronous `to_seed` that runs PBKDF2 off the event loop.
+
+        The derivation runs in `executor`, a shared thread pool sized to the CPU
+        count by default. At most `limit` derivations are in flight at once (one
+        per CPU by default); further callers wait without blocking the loop.
+        """
+        return await _run_bounded(executor, limit, cls.to_seed, mnemonic, passphrase)
+
+    @classmethod
+    def to_hd_master_key(cls, seed: bytes, testnet: bool = False) -> str:
+        if cls.metrics is None:
+            return cls._to_hd_master_key(seed, testnet)
+        with cls.metrics.measure("to_hd_master_key"):
+            return cls._to_hd_master_key(seed, testnet)
 
     @staticmethod
-    def to_hd_master_key(seed: bytes, testnet: bool = False) -> str:
+    def _to_hd_master_key(seed: bytes, testnet: bool = False) -> str:
         if len(seed) != 64:
-            raise ValueError("Provided seed should have length of 64")
+            raise _failure(
+                ValueError("Provided seed should have length of 64"), "seed_length"
+            )
 
         # Compute HMAC-SHA512 of seed
         seed = hmac.new(b"Bitcoin seed", seed, digestmod=hashlib.sha512).digest()
@@ -271,27 +916,168 @@ class Mnemonic(object):
         xprv += seed[32:]  # Chain code
         xprv += b"\x00" + seed[:32]  # Master key
 
-        # Double hash using SHA256
-        hashed_xprv = hashlib.sha256(xprv).digest()
-        hashed_xprv = hashlib.sha256(hashed_xprv).digest()
+        # Return base58 with 4 bytes of checksum
+        return b58encode_check(xprv)
 
-        # Append 4 bytes of checksum
-        xprv += hashed_xprv[:4]
+    @classmethod
+    async def to_hd_master_key_async(
+        cls,
+        seed: bytes,
+        testnet: bool = False,
+        executor: concurrent.futures.Executor | None = None,
+        limit: asyncio.Semaphore | None = None,
+    ) -> str:
+        """Asynchronous `to_hd_master_key`, see `to_seed_async`."""
+        return await _run_bounded(executor, limit, cls.to_hd_master_key, seed, testnet)
 
-        # Return base58
-        return b58encode(xprv)
 
+def _read_records(
+    stream: t.BinaryIO, width: int | None, chunk_size: int
+) -> t.Iterator[list[tuple[int, bytes | Exception]]]:
+    """Read entropies in chunks of (record number, entropy or parsing error).
 
-def main() -> None:
+    Records are newline-delimited hex strings, or raw binary records of `width`
+    bytes. Only one chunk is held in memory at a time.
+    """
+    number = 0
+    if width:
+        while True:
+            block = stream.read(width * chunk_size)
+            if not block:
+                return
+            chunk: list[tuple[int, bytes | Exception]] = []
+            for offset in range(0, len(block), width):
+                number += 1
+                record = block[offset : offset + width]
+                if len(record) != width:
+                    chunk.append((number, ValueError("Truncated record.")))
+                else:
+                    chunk.append((number, record))
+            yield chunk
+    lines = iter(stream)
+    while True:
+        chunk = []
+        for line in itertools.islice(lines, chunk_size):
+            number += 1
+            if not line.strip():
+                continue
+            try:
+                chunk.append((number, bytes.fromhex(line.decode("ascii").strip())))
+            except ValueError as e:
+                chunk.append((number, e))
+        if not chunk:
+            return
+        yield chunk
+
+
+def main(argv: t.Sequence[str] | None = None) -> None:
+    import argparse
+    import csv
+    import json
     import sys
 
-    if len(sys.argv) > 1:
-        hex_data = sys.argv[1]
+    parser = argparse.ArgumentParser(
+        description="Convert hex entropy to BIP39 mnemonics, seeds or master keys."
+    )
+    parser.add_argument(
+        "hex", nargs="?", help="entropy to convert; read from stdin if omitted"
+    )
+    parser.add_argument("-l", "--language", default="english")
+    parser.add_argument("-p", "--passphrase", default="")
+    parser.add_argument(
+        "-o",
+        "--output",
+        action="append",
+        choices=["entropy", "mnemonic", "seed", "xprv"],
+        help="fields to output, may be repeated (default: mnemonic)",
+    )
+    parser.add_argument(
+        "-f", "--format", choices=["text", "ndjson", "csv"], default="text"
+    )
+    parser.add_argument("--testnet", action="store_true", help="testnet xprv")
+    parser.add_argument(
+        "-s",
+        "--stream",
+        action="store_true",
+        help="convert every line of the input instead of just the first one",
+    )
+    parser.add_argument(
+        "-i", "--input", type=argparse.FileType("rb"), help="read from file"
+    )
+    parser.add_argument(
+        "-b",
+        "--binary",
+        type=int,
+        metavar="WIDTH",
+        help="input is raw binary records of WIDTH bytes",
+    )
+    parser.add_argument(
+        "-w", "--workers", type=int, default=1, help="seed derivation workers"
+    )
+    parser.add_argument("--chunk-size", type=int, default=1024)
+    args = parser.parse_args(argv)
+    fields = args.output or ["mnemonic"]
+
+    m = Mnemonic(args.language)
+    stream = args.input or sys.stdin.buffer
+    chunks: t.Iterable[list[tuple[int, bytes | Exception]]]
+    if args.hex is not None:
+        try:
+            chunks = [[(1, bytes.fromhex(args.hex))]]
+        except ValueError as e:
+            chunks = [[(1, e)]]
+    elif args.stream or args.input or args.binary:
+        chunks = _read_records(stream, args.binary, args.chunk_size)
     else:
-        hex_data = sys.stdin.readline().strip()
-    data = bytes.fromhex(hex_data)
-    m = Mnemonic("english")
-    print(m.to_mnemonic(data))
+        # a single record, a blank line is invalid rather than skipped
+        line = stream.readline()
+        try:
+            chunks = [[(1, bytes.fromhex(line.decode("ascii").strip()))]]
+        except ValueError as e:
+            chunks = [[(1, e)]]
+
+    out = sys.stdout
+    writer = csv.writer(out, lineterminator="\n")
+    if args.format == "csv":
+        writer.writerow(fields)
+    failed = False
+    for chunk in chunks:
+        records = []
+        for number, data in chunk:
+            if isinstance(data, Exception):
+                print(f"record {number}: {data}", file=sys.stderr)
+                failed = True
+            elif len(data) not in [16, 20, 24, 28, 32]:
+                print(f"record {number}: invalid length {len(data)}", file=sys.stderr)
+                failed = True
+            else:
+                records.append(data)
+        codes = t.cast(t.List[str], m.to_mnemonic_many(records))
+        seeds: list[bytes] = []
+        if "seed" in fields or "xprv" in fields:
+            seeds = Mnemonic.to_seed_many(codes, args.passphrase, args.workers)
+        rows = []
+        for i, data in enumerate(records):
+            values = {"entropy": data.hex(), "mnemonic": codes[i]}
+            if seeds:
+                values["seed"] = seeds[i].hex()
+                if "xprv" in fields:
+                    values["xprv"] = Mnemonic.to_hd_master_key(seeds[i], args.testnet)
+            rows.append([values[field] for field in fields])
+        if args.format == "ndjson":
+            out.writelines(
+                json.dumps(dict(zip(fields, row)), ensure_ascii=False) + "\n"
+                for row in rows
+            )
+        elif args.format == "csv":
+            writer.writerows(rows)
+        else:
+            out.writelines("\t".join(row) + "\n" for row in rows)
+    out.flush()
+    if args.input:
+        args.input.close()
+    if failed:
+        sys.exit(1)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,407 @@
+"""Recovery of mnemonics with typos, a wrong, swapped or missing word.
+
+Candidates are enumerated as lists of wordlist indexes and filtered by the BIP39
+checksum alone, which costs one SHA-256 each, so only plausible phrases are left
+for the expensive seed derivation. `match_master_key` then finds the one whose
+seed produces a known master key.
+"""
+from __future__ import annotations
+
+import concurrent.futures
+import hashlib
+import hmac
+import itertools
+import math
+import os
+import threading
+import typing as t
+
+from .bip32 import ExtendedKey
+from .mnemonic import PBKDF2_ROUNDS, Mnemonic, _decode
+
+Candidate = t.Tuple[int, ...]
+
+VALID_LENGTHS = (12, 15, 18, 21, 24)
+
+
+def edit_distance(a: str, b: str, limit: int | None = None) -> int:
+    """Levenshtein distance of `a` and `b`.
+
+    If `limit` is given, the search stops as soon as the distance is known to
+    exceed it and `limit + 1` is returned.
+    """
+    if limit is not None and abs(len(a) - len(b)) > limit:
+        return limit + 1
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i]
+        for j, cb in enumerate(b, 1):
+            current.append(
+                min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (ca != cb))
+            )
+        if limit is not None and min(current) > limit:
+            return limit + 1
+        previous = current
+    return previous[-1]
+
+
+def similar_words(mnemo: Mnemonic, word: str, max_distance: int = 2) -> list[int]:
+    """Indexes of the words that `word` may be a typo or abbreviation of.
+
+    Closer words come first. Words starting with `word` count as distance 1.
+    """
+    scored = []
+    for i, candidate in enumerate(mnemo.wordlist):
+        if word and candidate.startswith(word) and candidate != word:
+            distance = 1
+        else:
+            distance = edit_distance(word, candidate, max_distance)
+        if 0 < distance <= max_distance:
+            scored.append((distance, i))
+    scored.sort()
+    return [i for _, i in scored]
+
+
+# A block of candidates is the product of the options for each position, less
+# those whose words at the excluded positions are all in the excluded sets.
+# Blocks are cheap to send to a worker, which enumerates the candidates itself.
+Options = t.Tuple[t.Sequence[int], ...]
+Exclude = t.Tuple[t.Tuple[int, t.FrozenSet[int]], ...]
+Block = t.Tuple[Options, Exclude]
+# A slice [start, stop) of the candidates of a block
+Piece = t.Tuple[Options, Exclude, int, int]
+
+
+def _block_size(options: Options, exclude: Exclude) -> int:
+    size = math.prod(len(o) for o in options)
+    if exclude:
+        positions = dict(exclude)
+        size -= math.prod(
+            sum(1 for x in positions[i] if x in o) if i in positions else len(o)
+            for i, o in enumerate(options)
+        )
+    return size
+
+
+def _enumerate(options: Options, exclude: Exclude) -> t.Iterator[Candidate]:
+    candidates = itertools.product(*options)
+    if not exclude:
+        return candidates
+    return (c for c in candidates if not all(c[i] in ex for i, ex in exclude))
+
+
+def _split(options: Options, exclude: Exclude, limit: int) -> t.Iterator[Block]:
+    """Split a block into blocks of at most `limit` candidates, in order."""
+    if _block_size(options, exclude) <= limit:
+        yield options, exclude
+        return
+    # split the first position with a choice, into groups of whole sub-blocks
+    d = next(i for i, o in enumerate(options) if len(o) > 1)
+    step = max(limit // math.prod(len(o) for o in options[d + 1 :]), 1)
+    for start in range(0, len(options[d]), step):
+        part = options[:d] + (options[d][start : start + step],) + options[d + 1 :]
+        yield from _split(part, exclude, limit)
+
+
+def _chunks(
+    blocks: t.Iterable[Block], chunk_size: int, budget: int | None
+) -> t.Iterator[tuple[list[Piece], int]]:
+    """Cut the blocks into chunks of `chunk_size` candidates, at most `budget`."""
+    remaining = budget if budget is not None else math.inf
+    pieces: list[Piece] = []
+    count = 0
+    for block in blocks:
+        for options, exclude in _split(*block, chunk_size):
+            size = _block_size(options, exclude)
+            start = 0
+            while start < size:
+                if not remaining:
+                    if pieces:
+                        yield pieces, count
+                    return
+                n = int(min(size - start, chunk_size - count, remaining))
+                pieces.append((options, exclude, start, start + n))
+                start += n
+                count += n
+                remaining -= n
+                if count == chunk_size:
+                    yield pieces, count
+                    pieces, count = [], 0
+    if pieces:
+        yield pieces, count
+
+
+def _check_chunk(pieces: list[Piece]) -> list[Candidate]:
+    valid = []
+    for options, exclude, start, stop in pieces:
+        for c in itertools.islice(_enumerate(options, exclude), start, stop):
+            if _decode(list(c))[1]:
+                valid.append(c)
+    return valid
+
+
+class _Search(object):
+    """Describes the candidates for one phrase as blocks, in order of plausibility."""
+
+    def __init__(
+        self, mnemo: Mnemonic, words: list[str], max_distance: int, swaps: bool
+    ):
+        self.mnemo = mnemo
+        self.radix = len(mnemo.wordlist)
+        self.max_distance = max_distance
+        self.swaps = swaps
+        self.words = words
+        self.known = [mnemo.wordlist._resolve(w) for w in words]
+        self.near: list[list[int]] = []
+        for word, known in zip(words, self.known):
+            if known >= 0:
+                self.near.append([known])
+            else:
+                self.near.append(similar_words(mnemo, word, max_distance))
+
+    def blocks(self) -> t.Iterator[Block]:
+        n = len(self.words)
+        every = range(self.radix)
+        if n in VALID_LENGTHS:
+            # typos and abbreviations of unknown words
+            yield tuple(self.near), ()
+            unknown = [i for i, k in enumerate(self.known) if k < 0]
+            if unknown:
+                # any other word in place of the unknown ones
+                yield (
+                    tuple(every if k < 0 else o for k, o in zip(self.known, self.near)),
+                    tuple((i, frozenset(self.near[i])) for i in unknown),
+                )
+            else:
+                yield from self._known_word_errors()
+        if n + 1 in VALID_LENGTHS:
+            # one word is missing
+            options = [o or every for o in self.near]
+            for position in range(n + 1):
+                yield tuple(options[:position] + [every] + options[position:]), ()
+
+    def _known_word_errors(self) -> t.Iterator[Block]:
+        base = tuple([k] for k in self.known)
+        wordlist = self.mnemo.wordlist
+        similar = {
+            i: similar_words(self.mnemo, wordlist[i], self.max_distance)
+            for i in set(self.known)
+        }
+        # a valid word that is similar to the intended one
+        for position, word in enumerate(self.known):
+            yield base[:position] + (similar[word],) + base[position + 1 :], ()
+        if self.swaps:
+            for i, j in itertools.combinations(range(len(base)), 2):
+                swapped = list(base)
+                swapped[i], swapped[j] = swapped[j], swapped[i]
+                yield tuple(swapped), ()
+        # any other word
+        every = range(self.radix)
+        for position, word in enumerate(self.known):
+            exclude = frozenset(similar[word]) | {word}
+            yield base[:position] + (every,) + base[position + 1 :], (
+                (position, exclude),
+            )
+
+
+def recover(
+    mnemo: Mnemonic,
+    phrase: str | list[str],
+    max_distance: int = 2,
+    swaps: bool = True,
+    budget: int | None = 10_000_000,
+    workers: int = 1,
+    progress: t.Callable[[int], None] | None = None,
+    chunk_size: int = 4096,
+) -> list[str]:
+    """
+    Return checksum-valid mnemonics close to a mistyped `phrase`.
+
+    For a phrase of valid length, words not in the wordlist are replaced by
+    similar words (up to `max_distance` edits, or prefix completions) first,
+    then by any word. If every word is known, single word substitutions
+    (similar words first) and swapped word pairs are tried. For a phrase one
+    word short of a valid length, every word is tried at every position.
+
+    At most `budget` candidates are checked, by `workers` processes in chunks
+    of `chunk_size`; each worker enumerates the candidates of its chunk itself.
+    `progress` is called with the number checked so far after each chunk.
+    Results are ordered by plausibility and are all valid according to
+    `Mnemonic.check`; each still needs to be confirmed, e.g. by its seed.
+    """
+    if isinstance(phrase, str):
+        words = Mnemonic.normalize_string(phrase).split()
+    else:
+        words = list(phrase)
+    if len(words) not in VALID_LENGTHS and len(words) + 1 not in VALID_LENGTHS:
+        raise ValueError(
+            "Number of words must be one of the following: [11, 12, 14, 15, 17, 18, 20, 21, 23, 24], but it is not (%d)."
+            % len(words)
+        )
+    if chunk_size < 1:
+        raise ValueError("Chunk size must be at least 1.")
+    if budget is not None and budget < 0:
+        raise ValueError("Budget must not be negative.")
+    blocks = _Search(mnemo, words, max_distance, swaps).blocks()
+    chunks = _chunks(blocks, chunk_size, budget)
+
+    found: dict[Candidate, None] = {}
+    checked = 0
+
+    def collect(count: int, valid: list[Candidate]) -> None:
+        nonlocal checked
+        checked += count
+        found.update(dict.fromkeys(valid))
+        if progress is not None:
+            progress(checked)
+
+    if workers <= 1:
+        for pieces, count in chunks:
+            collect(count, _check_chunk(pieces))
+    else:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+            # keep a bounded number of chunks in flight, in submission order
+            pending: list[tuple[int, concurrent.futures.Future]] = []
+            for pieces, count in chunks:
+                pending.append((count, executor.submit(_check_chunk, pieces)))
+                if len(pending) >= workers * 2:
+                    done, future = pending.pop(0)
+                    collect(done, future.result())
+            for done, future in pending:
+                collect(done, future.result())
+
+    wordlist = mnemo.wordlist
+    return [mnemo.delimiter.join(wordlist[i] for i in c) for c in found]
+
+
+# HMAC-SHA512 keyed with "Bitcoin seed", copied for every candidate seed
+_MASTER_HMAC = hmac.new(b"Bitcoin seed", digestmod=hashlib.sha512)
+
+_Item = t.Tuple[bytes, bytes, str, str]
+
+
+def _match_chunk(
+    chunk: list[_Item], chain_code: bytes, key: bytes | None, stop: threading.Event
+) -> tuple[str, str] | None:
+    for password, salt, mnemonic, passphrase in chunk:
+        if stop.is_set():
+            return None
+        seed = hashlib.pbkdf2_hmac("sha512", password, salt, PBKDF2_ROUNDS)
+        mac = _MASTER_HMAC.copy()
+        mac.update(seed)
+        i = mac.digest()
+        if i[32:] == chain_code and (key is None or i[:32] == key):
+            return mnemonic, passphrase
+    return None
+
+
+def _pairs(
+    mnemonics: t.Iterable[str], passphrases: t.Iterable[str]
+) -> t.Iterator[tuple[str, str]]:
+    missing = object()
+    for m, p in itertools.zip_longest(mnemonics, passphrases, fillvalue=missing):
+        if m is missing or p is missing:
+            raise ValueError("Got a different number of mnemonics and passphrases.")
+        yield t.cast(str, m), t.cast(str, p)
+
+
+def match_master_key(
+    target: str | ExtendedKey,
+    mnemonics: t.Iterable[str] | str,
+    passphrases: t.Iterable[str] | str = "",
+    workers: int | None = None,
+    chunk_size: int = 16,
+) -> tuple[str, str] | None:
+    """
+    Find the (mnemonic, passphrase) whose master key is `target`.
+
+    `target` is a master xprv or xpub, e.g. from `Mnemonic.to_hd_master_key`.
+    Either `mnemonics` or `passphrases` may be a single string shared by all
+    candidates, which is then normalized and encoded only once; if both are
+    iterables they are paired up and must have the same length.
+
+    Each candidate is compared by the raw chain code and private key computed
+    from its seed, without building the serialized key. For an xpub the chain
+    code decides and the public key is verified once for the match. Candidates
+    are derived by `workers` threads (the CPU count by default), and the
+    search stops at the first match. Returns None if nothing matches.
+    """
+    if isinstance(target, str):
+        target = ExtendedKey.parse(target)
+    if target.depth != 0:
+        raise ValueError("Target is not a master key")
+    if chunk_size < 1:
+        raise ValueError("Chunk size must be at least 1.")
+    key = target.private_key
+
+    def encode(text: str) -> bytes:
+        return Mnemonic.normalize_string(text).encode("utf-8")
+
+    items: t.Iterator[_Item]
+    if isinstance(mnemonics, str):
+        password = encode(mnemonics)
+        items = (
+            (password, b"mnemonic" + encode(p), mnemonics, p)
+            for p in ([passphrases] if isinstance(passphrases, str) else passphrases)
+        )
+    elif isinstance(passphrases, str):
+        salt = b"mnemonic" + encode(passphrases)
+        items = ((encode(m), salt, m, passphrases) for m in mnemonics)
+    else:
+        items = (
+            (encode(m), b"mnemonic" + encode(p), m, p)
+            for m, p in _pairs(mnemonics, passphrases)
+        )
+    chunks = iter(lambda: list(itertools.islice(items, chunk_size)), [])
+
+    def confirm(match: tuple[str, str] | None) -> tuple[str, str] | None:
+        if match is not None and key is None:
+            # the chain code matched an xpub, compare the public key as well
+            seed = Mnemonic.to_seed(*match)
+            if ExtendedKey.from_seed(seed).public_key != target.public_key:
+                return None
+        return match
+
+    stop = threading.Event()
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers <= 1:
+        for chunk in chunks:
+            match = confirm(_match_chunk(chunk, target.chain_code, key, stop))
+            if match is not None:
+                return match
+        return None
+
+    def first_match(
+        pending: set[concurrent.futures.Future],
+    ) -> tuple[tuple[str, str] | None, set[concurrent.futures.Future]]:
+        done, rest = concurrent.futures.wait(
+            pending, return_when=concurrent.futures.FIRST_COMPLETED
+        )
+        for future in done:
+            match = confirm(future.result())
+            if match is not None:
+                return match, rest
+        return None, rest
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+        pending: set[concurrent.futures.Future] = set()
+        try:
+            for chunk in chunks:
+                pending.add(
+                    executor.submit(_match_chunk, chunk, target.chain_code, key, stop)
+                )
+                # keep a bounded number of chunks in flight
+                while len(pending) >= workers * 2:
+                    match, pending = first_match(pending)
+                    if match is not None:
+                        return match
+            while pending:
+                match, pending = first_match(pending)
+                if match is not None:
+                    return match
+            return None
+        finally:
+            stop.set()
+            for future in pending:
+                future.cancel()
@@ -21,12 +21,37 @@
 # CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 #
 
+import array
+import asyncio
+import contextlib
+import io
 import json
+import os
 import random
+import tempfile
+import unicodedata
 import unittest
-from typing import List
+from typing import List, Literal, Tuple
+from unittest import mock
 
 from mnemonic import Mnemonic
+from mnemonic.base58 import (
+    b58decode,
+    b58decode_check,
+    b58encode,
+    b58encode_check,
+    b58encode_many,
+)
+from mnemonic.bip32 import HARDENED, ExtendedKey, _ripemd160, parse_path
+from mnemonic.cache import SeedCache
+from mnemonic.metrics import Metrics
+from mnemonic.mnemonic import ConfigurationError, main
+from mnemonic.recovery import (
+    edit_distance,
+    match_master_key,
+    recover,
+    similar_words,
+)
 
 
 class MnemonicTest(unittest.TestCase):
@@ -47,6 +72,38 @@ class MnemonicTest(unittest.TestCase):
         for lang in vectors.keys():
             self._check_list(lang, vectors[lang])
 
+    def test_wordlist(self) -> None:
+        m = Mnemonic("english")
+        self.assertIs(m.wordlist, Mnemonic("english").wordlist)
+        with self.assertRaises(AttributeError):
+            m.wordlist = []  # type: ignore
+        with self.assertRaises(AttributeError):
+            m.extra = 1  # type: ignore
+        self.assertEqual(len(m.wordlist), 2048)
+        self.assertEqual(m.wordlist[3], "about")
+        self.assertEqual(m.wordlist.index("about"), 3)
+        self.assertIn("about", m.wordlist)
+        self.assertNotIn("xxxxxxx", m.wordlist)
+        with self.assertRaises(ValueError):
+            m.wordlist.index("xxxxxxx")
+        with self.assertRaises(ValueError):
+            m.wordlist.index("xxxxxxx", -5)
+        with self.assertRaises(ValueError):
+            m.wordlist.index("about", -5)
+        self.assertEqual(m.wordlist.index("zoo", -5), 2047)
+        self.assertEqual(m.wordlist, list(m.wordlist))
+        self.assertEqual(m.wordlist, tuple(m.wordlist))
+        self.assertNotEqual(m.wordlist, list(m.wordlist)[:-1])
+
+        custom = Mnemonic("custom", list(m.wordlist))
+        self.assertIsNot(custom.wordlist, m.wordlist)
+        self.assertEqual(list(custom.wordlist), list(m.wordlist))
+        with self.assertRaises(ConfigurationError):
+            Mnemonic("custom", list(m.wordlist)[:-1])
+        with self.assertRaises(ConfigurationError):
+            Mnemonic("klingon")
+        self.assertIn("english", Mnemonic.list_languages())
+
     def test_failed_checksum(self) -> None:
         code = (
             "bless cloud wheel regular tiny venue bird web grief security dignity zoo"
@@ -119,6 +176,19 @@ class MnemonicTest(unittest.TestCase):
         self.assertEqual(seed_nfkd, seed_nfkc)
         self.assertEqual(seed_nfkd, seed_nfd)
 
+    def test_to_entropy_normalization(self) -> None:
+        data = bytes(range(32))
+        for lang in ["korean", "french", "japanese", "spanish"]:
+            m = Mnemonic(lang)
+            words = m.to_mnemonic(data).split(m.delimiter)
+            forms: Tuple[Literal["NFC", "NFKC", "NFD", "NFKD"], ...]
+            forms = ("NFC", "NFKC", "NFD", "NFKD")
+            for form in forms:
+                nf = [unicodedata.normalize(form, w) for w in words]
+                self.assertEqual(m.to_entropy(nf), data, (lang, form))
+        self.assertEqual(Mnemonic.normalize_string(b"abandon"), "abandon")
+        self.assertEqual(Mnemonic.normalize_string("\u00e9"), "e\u0301")
+
     def test_to_entropy(self) -> None:
         data = [bytes(random.getrandbits(8) for _ in range(32)) for _ in range(1024)]
         data.append(b"Lorem ipsum dolor sit amet amet.")
@@ -126,6 +196,422 @@ class MnemonicTest(unittest.TestCase):
         for d in data:
             self.assertEqual(m.to_entropy(m.to_mnemonic(d).split()), d)
 
+    def test_to_entropy_errors(self) -> None:
+        m = Mnemonic("english")
+        with self.assertRaises(ValueError):
+            m.to_entropy(["abandon"] * 11 + ["xxxxxxx"])
+        with self.assertRaises(ValueError):
+            m.to_entropy(["abandon"] * 11)
+        with self.assertRaises(ValueError):
+            m.to_entropy(["abandon"] * 12)  # bad checksum
+
+    def test_batch(self) -> None:
+        m = Mnemonic("english")
+        data = [bytes(random.getrandbits(8) for _ in range(n)) for n in (16, 24, 32)]
+        codes = [m.to_mnemonic(d) for d in data]
+        self.assertEqual(m.to_mnemonic_many(data), codes)
+        self.assertEqual(m.to_mnemonic_many(d for d in data), codes)
+        self.assertEqual(m.to_mnemonic_many(b"".join(data[:1] * 3), 16), codes[:1] * 3)
+        self.assertEqual(m.check_many(codes + ["abandon"]), [True, True, True, False])
+        self.assertEqual(m.to_entropy_many(codes), data)
+
+        errors: dict = {}
+        self.assertEqual(
+            m.to_mnemonic_many([data[0], b"short", data[1]], errors=errors),
+            [codes[0], None, codes[1]],
+        )
+        self.assertEqual(list(errors), [1])
+        errors = {}
+        self.assertEqual(
+            m.to_entropy_many([codes[0], "abandon " * 12], errors=errors),
+            [data[0], None],
+        )
+        self.assertIsInstance(errors[1], ValueError)
+        with self.assertRaises(ValueError):
+            m.to_mnemonic_many(b"\x00" * 17, 16)
+
+        # items of the wrong type are reported per position as well
+        items: list = [data[0], "entropy", None]
+        errors = {}
+        self.assertEqual(
+            m.to_mnemonic_many(items, errors=errors), [codes[0], None, None]
+        )
+        self.assertEqual(sorted(errors), [1, 2])
+        errors = {}
+        items = [None, codes[1]]
+        self.assertEqual(m.to_entropy_many(items, errors=errors), [None, data[1]])
+        self.assertEqual(list(errors), [0])
+        errors = {}
+        items = [codes[2], None]
+        self.assertEqual(m.check_many(items, errors=errors), [True, False])
+        self.assertIsInstance(errors[1], TypeError)
+
+    def test_generate_stream(self) -> None:
+        m = Mnemonic("english")
+        codes = list(m.generate_stream(100, 256, block_size=100))
+        self.assertEqual(len(codes), 100)
+        self.assertEqual(len(set(codes)), 100)
+        self.assertTrue(all(len(c.split(" ")) == 24 and m.check(c) for c in codes))
+        self.assertEqual(list(m.generate_stream(0)), [])
+
+        for data, code, seed in m.generate_stream(3, with_seed=True, passphrase="x"):
+            self.assertEqual(len(data), 16)
+            self.assertEqual(m.to_mnemonic(data), code)
+            self.assertEqual(Mnemonic.to_seed(code, "x"), seed)
+        with self.assertRaises(ValueError):
+            m.generate_stream(1, 100)
+
+    def test_to_seed_many(self) -> None:
+        m = Mnemonic("english")
+        codes = [m.generate() for _ in range(8)]
+        passphrases = [str(i) for i in range(8)]
+        expected = [Mnemonic.to_seed(c, p) for c, p in zip(codes, passphrases)]
+        self.assertEqual(Mnemonic.to_seed_many(codes, passphrases, workers=4), expected)
+        self.assertEqual(
+            Mnemonic.to_seed_many(codes, passphrases, workers=2, processes=True),
+            expected,
+        )
+        self.assertEqual(
+            Mnemonic.to_seed_many(codes, "TREZOR", workers=1),
+            [Mnemonic.to_seed(c, "TREZOR") for c in codes],
+        )
+        with self.assertRaises(ValueError):
+            Mnemonic.to_seed_many(codes, workers=0)
+        with self.assertRaises(ValueError):
+            Mnemonic.to_seed_many(codes, passphrases[:2], workers=2)
+
+    def test_buffers(self) -> None:
+        m = Mnemonic("english")
+        data = [bytes(random.getrandbits(8) for _ in range(16)) for _ in range(3)]
+        codes = [m.to_mnemonic(d) for d in data]
+        block = bytearray(b"".join(data))
+        view = memoryview(block)
+        self.assertEqual(m.to_mnemonic(view[16:32]), codes[1])
+        self.assertEqual(m.to_mnemonic(view.cast("I")[4:8]), codes[1])
+        self.assertEqual(m.to_mnemonic_many(array.array("B", block), 16), codes)
+        self.assertEqual(m.to_mnemonic_many([view[:16], data[2]]), codes[::2])
+
+        entropy = m.to_entropy(codes[0])
+        self.assertIs(type(entropy), bytes)
+        out = bytearray(20)
+        self.assertEqual(m.to_entropy(codes[1], out=out), data[1])
+        self.assertEqual(out, data[1] + bytes(4))
+        with self.assertRaises(ValueError):
+            m.to_entropy(codes[1], out=bytearray(8))
+        with self.assertRaises(TypeError):
+            m.to_entropy(codes[1], out=memoryview(bytes(16)))
+
+        out = bytearray(48)
+        errors: dict = {}
+        entropies = m.to_entropy_many(
+            [codes[2], m.generate(256), codes[0]], errors=errors, out=out, width=16
+        )
+        self.assertEqual(entropies, [data[2], None, data[0]])
+        self.assertEqual(list(errors), [1])
+        self.assertEqual(out, data[2] + bytes(16) + data[0])
+        with self.assertRaises(TypeError):
+            m.to_entropy_many(codes, out=memoryview(bytes(48)), width=16)
+        out = bytearray(32)
+        with self.assertRaises(ValueError):
+            m.to_entropy_many(codes, out=out, width=16)
+        self.assertEqual(out, bytes(32))
+
+        seed = Mnemonic.to_seed(codes[0], "TREZOR")
+        self.assertIs(type(seed), bytes)
+        out = bytearray(64)
+        self.assertEqual(Mnemonic.to_seed(codes[0], "TREZOR", out=out), seed)
+        self.assertEqual(out, seed)
+
+        expected = [Mnemonic.to_seed(c) for c in codes]
+        for workers, processes in ((1, False), (2, False), (2, True)):
+            out = bytearray(3 * 64)
+            seeds = Mnemonic.to_seed_many(
+                codes, workers=workers, processes=processes, out=out
+            )
+            self.assertEqual(seeds, expected)
+            self.assertEqual(out, b"".join(expected))
+        with self.assertRaises(ValueError):
+            Mnemonic.to_seed_many(codes, workers=1, out=bytearray(64))
+
+    def test_async(self) -> None:
+        code = Mnemonic("english").generate()
+        seed = Mnemonic.to_seed(code, "TREZOR")
+
+        async def derive() -> list:
+            limit = asyncio.Semaphore(2)
+            seeds = await asyncio.gather(
+                *(Mnemonic.to_seed_async(code, "TREZOR", limit=limit) for _ in range(4))
+            )
+            xprv = await Mnemonic.to_hd_master_key_async(seeds[0])
+            # a cancelled derivation must give its slot back
+            task = asyncio.ensure_future(Mnemonic.to_seed_async(code, limit=limit))
+            await asyncio.sleep(0)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+            await asyncio.wait_for(Mnemonic.to_seed_async(code, limit=limit), 10)
+            await asyncio.wait_for(Mnemonic.to_seed_async(code, limit=limit), 10)
+            return seeds + [xprv]
+
+        result = asyncio.run(derive())
+        self.assertEqual(result[:4], [seed] * 4)
+        self.assertEqual(result[4], Mnemonic.to_hd_master_key(seed))
+
+    def test_main(self) -> None:
+        entropy = "7f" * 16
+        code = Mnemonic("english").to_mnemonic(bytes.fromhex(entropy))
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            main([entropy])
+        self.assertEqual(out.getvalue(), code + "\n")
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "input.txt")
+            with open(path, "w") as f:
+                f.write(entropy + "\n\n" + entropy + "\n")
+            out = io.StringIO()
+            with contextlib.redirect_stdout(out):
+                main(["-i", path, "-f", "ndjson", "-o", "entropy", "-o", "mnemonic"])
+        record = {"entropy": entropy, "mnemonic": code}
+        self.assertEqual(
+            [json.loads(line) for line in out.getvalue().splitlines()], [record] * 2
+        )
+
+        # without --stream only the first line is read, and it must be valid
+        stdin = io.TextIOWrapper(io.BytesIO(b"\n" + entropy.encode() + b"\n"))
+        err = io.StringIO()
+        with mock.patch("sys.stdin", stdin), contextlib.redirect_stderr(err):
+            with self.assertRaises(SystemExit):
+                main([])
+        self.assertIn("record 1", err.getvalue())
+
+        err = io.StringIO()
+        with contextlib.redirect_stderr(err), self.assertRaises(SystemExit):
+            main(["not hex"])
+        self.assertIn("record 1", err.getvalue())
+
+    def test_base58(self) -> None:
+        self.assertEqual(b58encode(b""), "")
+        self.assertEqual(b58encode(b"\x00\x00\x01"), "112")
+        self.assertEqual(b58encode(b"hello world"), "StV1DL6CwTryKyV")
+        self.assertEqual(b58decode("112"), b"\x00\x00\x01")
+        self.assertEqual(b58decode("StV1DL6CwTryKyV"), b"hello world")
+        with self.assertRaises(ValueError):
+            b58decode("0OIl")
+
+        # Bitcoin address of the all-zero hash160
+        payload = b"\x00" * 21
+        self.assertEqual(b58encode_check(payload), "1111111111111111111114oLvT2")
+        self.assertEqual(b58decode_check("1111111111111111111114oLvT2"), payload)
+        with self.assertRaises(ValueError):
+            b58decode_check("1111111111111111111114oLvT3")
+
+        data = [bytes(random.getrandbits(8) for _ in range(n)) for n in range(100)]
+        data += [b"\x00" * n + d for n, d in enumerate(data[:8])]
+        for d, s in zip(data, b58encode_many(data, check=True)):
+            self.assertEqual(b58decode_check(s), d)
+
+    def test_bip32(self) -> None:
+        # Test vector 1 from BIP32
+        seed = bytes.fromhex("000102030405060708090a0b0c0d0e0f")
+        m = ExtendedKey.from_seed(seed)
+        self.assertEqual(
+            m.to_xprv(),
+            "xprv9s21ZrQH143K3QTDL4LXw2F7HEK3wJUD2nW2nRk4stbPy6cq3jPPqjiChkVvvNKmPGJxWUtg6LnF5kejMRNNU3TGtRBeJgk33yuGBxrMPHi",
+        )
+        self.assertEqual(
+            m.to_xpub(),
+            "xpub661MyMwAqRbcFtXgS5sYJABqqG9YLmC4Q1Rdap9gSE8NqtwybGhePY2gZ29ESFjqJoCu1Rupje8YtGqsefD265TMg7usUDFdp6W1EGMcet8",
+        )
+        node = m.derive("m/0H/1")
+        self.assertEqual(
+            node.to_xprv(),
+            "xprv9wTYmMFdV23N2TdNG573QoEsfRrWKQgWeibmLntzniatZvR9BmLnvSxqu53Kw1UmYPxLgboyZQaXwTCg8MSY3H2EU4pWcQDnRnrVA1xe8fs",
+        )
+        self.assertEqual(
+            node.to_xpub(),
+            "xpub6ASuArnXKPbfEwhqN6e3mwBcDTgzisQN1wXN9BJcM47sSikHjJf3UFHKkNAWbWMiGj7Wf5uMash7SyYq527Hqck2AxYysAA7xmALppuCkwQ",
+        )
+        self.assertEqual(
+            m.derive("m/0'/1/2h/2/1000000000").to_xprv(),
+            "xprvA41z7zogVVwxVSgdKUHDy1SKmdb533PjDz7J6N6mV6uS3ze1ai8FHa8kmHScGpWmj4WggLyQjgPie1rFSruoUihUZREPSL39UNdE3BBDu76",
+        )
+        # public derivation matches private derivation
+        self.assertEqual(
+            m.derive("m/0H").neuter().derive("1").to_xpub(), node.to_xpub()
+        )
+        with self.assertRaises(ValueError):
+            m.neuter().derive("m/0H")
+        # the derived node comes from the cache the second time
+        self.assertIs(m.derive([HARDENED, 1]), node)
+        self.assertEqual(
+            parse_path("m/44'/0'/0'/0/5"), (HARDENED + 44, HARDENED, HARDENED, 0, 5)
+        )
+        with self.assertRaises(ValueError):
+            parse_path("m/x")
+
+        # the master key of Mnemonic.to_hd_master_key parses back
+        xprv = Mnemonic.to_hd_master_key(seed + bytes(48))
+        self.assertEqual(ExtendedKey.parse(xprv).to_xprv(), xprv)
+        self.assertEqual(ExtendedKey.parse(node.to_xpub()).to_xpub(), node.to_xpub())
+
+        # fallback for hashlib builds without RIPEMD-160
+        self.assertEqual(
+            _ripemd160(b"").hex(), "9c1185a5c5e9fc54612808977ee8f548b2258d31"
+        )
+        self.assertEqual(
+            _ripemd160(b"abc").hex(), "8eb208f7e05d987a9b044a8e98c6b087f15a0bfc"
+        )
+
+    def test_seed_cache(self) -> None:
+        now = [0.0]
+        cache = SeedCache(maxsize=2, ttl=10, clock=lambda: now[0])
+        m = Mnemonic("english")
+        codes = [m.generate() for _ in range(3)]
+        seed = Mnemonic.to_seed(codes[0], "TREZOR")
+
+        self.assertEqual(cache.to_seed(codes[0], "TREZOR"), seed)
+        self.assertEqual(cache.to_seed(codes[0], "TREZOR"), seed)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        self.assertNotEqual(cache.to_seed(codes[0]), seed)  # other passphrase
+        self.assertEqual(len(cache), 2)
+
+        # the least recently used entry is evicted and zeroized
+        stored = [e[0] for e in cache._entries.values()]
+        cache.to_seed(codes[1])
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.evictions, 1)
+        self.assertIn(bytearray(64), stored)
+        self.assertNotIn(codes[0].encode(), b"".join(cache._entries))
+
+        # entries expire after ttl
+        now[0] = 11
+        cache.to_seed(codes[1])
+        self.assertEqual(cache.misses, 4)
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+        with self.assertRaises(ValueError):
+            SeedCache(maxsize=0)
+
+    def test_metrics(self) -> None:
+        calls = []
+        metrics = Metrics([lambda op, _, reason: calls.append((op, reason))])
+        m = Mnemonic("english")
+        code = m.to_mnemonic(bytes(16))
+        Mnemonic.metrics = metrics
+        try:
+            m.to_entropy(code)
+            self.assertTrue(m.check(code))
+            self.assertFalse(m.check("abandon " * 11 + "xxxxxxx"))
+            self.assertFalse(m.check("abandon " * 11 + "abandon"))
+            with self.assertRaises(ValueError):
+                m.to_entropy(["abandon"] * 11)
+            seed = Mnemonic.to_seed(code)
+            Mnemonic.to_hd_master_key(seed)
+            with self.assertRaises(ValueError):
+                Mnemonic.to_hd_master_key(seed[:32])
+            Mnemonic.detect_language(code)
+            with self.assertRaises(ConfigurationError):
+                Mnemonic.detect_language("xxxxxxx")
+        finally:
+            Mnemonic.metrics = None
+        m.check(code)  # disabled again
+
+        self.assertEqual(
+            calls,
+            [
+                ("to_entropy", None),
+                ("check", None),
+                ("check", "word"),
+                ("check", "checksum"),
+                ("to_entropy", "length"),
+                ("to_seed", None),
+                ("to_hd_master_key", None),
+                ("to_hd_master_key", "seed_length"),
+                ("detect_language", None),
+                ("detect_language", "unrecognized"),
+            ],
+        )
+        self.assertEqual(metrics.calls["check"], 3)
+        self.assertEqual(metrics.failures["check", "checksum"], 1)
+        text = metrics.to_prometheus()
+        self.assertIn('mnemonic_calls_total{operation="check"} 3\n', text)
+        self.assertIn(
+            'mnemonic_failures_total{operation="to_entropy",reason="length"} 1\n', text
+        )
+        self.assertIn('mnemonic_duration_seconds_count{operation="to_seed"} 1\n', text)
+        metrics.reset()
+        self.assertEqual(sum(metrics.calls.values()), 0)
+
+    def test_recover(self) -> None:
+        m = Mnemonic("english")
+        code = m.to_mnemonic(bytes(range(16)))
+        words = code.split(" ")
+
+        typo = words[:3] + ["amuont"] + words[4:]
+        found = recover(m, " ".join(typo))
+        # similar words come first, then any word with a valid checksum
+        self.assertEqual(found[0], code)
+        replaced = [" ".join(words[:3] + [w] + words[4:]) for w in m.wordlist]
+        self.assertEqual(set(found), {c for c in replaced if m.check(c)})
+
+        # "abandon" is not within two edits of "hello1", but "hello" is
+        typo = ["hello1"] + words[1:]
+        self.assertIn(code, recover(m, typo))
+        self.assertEqual(recover(m, typo, workers=2, chunk_size=100), recover(m, typo))
+
+        missing = words[:5] + words[6:]
+        found = recover(m, missing)
+        self.assertIn(code, found)
+        self.assertTrue(all(m.check(c) for c in found))
+
+        swapped = list(words)
+        swapped[2], swapped[7] = swapped[7], swapped[2]
+        checked: List[int] = []
+        found = recover(m, " ".join(swapped), workers=2, progress=checked.append)
+        self.assertIn(code, found)
+        self.assertEqual(checked, sorted(checked))
+        self.assertEqual(found, recover(m, " ".join(swapped)))
+
+        checked = []
+        found = recover(m, missing, budget=100, chunk_size=30, progress=checked.append)
+        self.assertNotIn(code, found)
+        self.assertEqual(checked, [30, 60, 90, 100])
+        with self.assertRaises(ValueError):
+            recover(m, words[:10])
+        with self.assertRaises(ValueError):
+            recover(m, missing, chunk_size=0)
+        with self.assertRaises(ValueError):
+            recover(m, missing, budget=-1)
+        self.assertEqual(edit_distance("kitten", "sitting"), 3)
+        self.assertEqual(edit_distance("kitten", "sitting", limit=1), 2)
+        self.assertEqual(similar_words(m, "acce")[0], m.wordlist.index("access"))
+
+    def test_match_master_key(self) -> None:
+        m = Mnemonic("english")
+        codes = [m.to_mnemonic(bytes([i]) * 16) for i in range(6)]
+        xprv = Mnemonic.to_hd_master_key(Mnemonic.to_seed(codes[4], "TREZOR"))
+        xpub = ExtendedKey.parse(xprv).to_xpub()
+
+        expected = (codes[4], "TREZOR")
+        self.assertEqual(match_master_key(xprv, codes, "TREZOR", workers=1), expected)
+        self.assertEqual(
+            match_master_key(xpub, codes, "TREZOR", workers=2, chunk_size=1), expected
+        )
+        self.assertEqual(
+            match_master_key(xprv, codes[4], ["", "trezor", "TREZOR"]), expected
+        )
+        self.assertEqual(
+            match_master_key(xprv, codes[3:], ["TREZOR", "TREZOR", "x"]), expected
+        )
+        self.assertIsNone(match_master_key(xprv, codes[:4], "TREZOR"))
+        with self.assertRaises(ValueError):
+            match_master_key(ExtendedKey.parse(xprv).derive("m/0"), codes)
+        with self.assertRaises(ValueError):
+            match_master_key(xprv, codes[:4], ["TREZOR"] * 3)
+        with self.assertRaises(ValueError):
+            match_master_key(xprv, codes, "TREZOR", chunk_size=0)
+
     def test_expand_word(self) -> None:
         m = Mnemonic("english")
         self.assertEqual("", m.expand_word(""))
@@ -141,6 +627,21 @@ class MnemonicTest(unittest.TestCase):
             "action", m.expand_word("acti")
         )  # unique prefix expanded to word in list
 
+    def test_autocomplete(self) -> None:
+        m = Mnemonic("english")
+        self.assertEqual(
+            ["access", "accident", "account", "accuse"], m.autocomplete("acc")
+        )
+        self.assertEqual(["access", "accident"], m.autocomplete("acc", limit=2))
+        self.assertEqual(
+            ["act", "action", "actor", "actress", "actual"], m.autocomplete("act")
+        )
+        self.assertEqual([], m.autocomplete("acb"))
+        self.assertEqual(2048, len(m.autocomplete("")))
+        self.assertEqual(["zoo"], m.autocomplete("zoo"))
+        self.assertTrue(m.wordlist.is_prefix("zo"))
+        self.assertFalse(m.wordlist.is_prefix("zz"))
+
     def test_expand(self) -> None:
         m = Mnemonic("english")
         self.assertEqual("access", m.expand("access"))
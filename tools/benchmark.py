@@ -0,0 +1,333 @@
+#!/usr/bin/env python3
+
+import argparse
+import json
+import os
+import platform
+import sys
+import timeit
+import typing as t
+import unicodedata
+
+from mnemonic import Mnemonic
+from mnemonic.base58 import b58decode_check, b58encode, b58encode_check
+from mnemonic.bip32 import ExtendedKey
+from mnemonic.metrics import Metrics
+
+WORD_COUNTS = [12, 15, 18, 21, 24]
+SUITE_LANGUAGES = ["english", "japanese", "korean", "chinese_simplified", "french"]
+
+
+def measure(stmt: t.Callable[[], object], number: int) -> float:
+    """Return the best per-call time in microseconds."""
+    timer = timeit.Timer(stmt)
+    return min(timer.repeat(repeat=5, number=number)) / number * 1e6
+
+
+def phrases(mnemo: Mnemonic) -> t.Dict[int, str]:
+    return {
+        words: mnemo.to_mnemonic(bytes(range(words * 4 // 3))) for words in WORD_COUNTS
+    }
+
+
+def bench_lookup(number: int) -> None:
+    mnemo = Mnemonic("english")
+    print("word lookup (us per phrase)")
+    print("%6s %12s %12s %8s" % ("words", "list.index", "dict", "speedup"))
+    for words, code in phrases(mnemo).items():
+        lst = code.split(" ")
+        wordlist = list(mnemo.wordlist)
+        index = mnemo._index
+        scan = measure(lambda: [wordlist.index(w) for w in lst], number)
+        lookup = measure(lambda: [index[w] for w in lst], number)
+        print("%6d %12.2f %12.2f %7.1fx" % (words, scan, lookup, scan / lookup))
+    print()
+
+
+def bench_codec(number: int) -> None:
+    mnemo = Mnemonic("english")
+    print("codec (us per call)")
+    print("%6s %12s %12s %12s" % ("words", "to_mnemonic", "to_entropy", "check"))
+    for words, code in phrases(mnemo).items():
+        data = mnemo.to_entropy(code)
+        encode = measure(lambda: mnemo.to_mnemonic(data), number)
+        decode = measure(lambda: mnemo.to_entropy(code), number)
+        check = measure(lambda: mnemo.check(code), number)
+        print("%6d %12.2f %12.2f %12.2f" % (words, encode, decode, check))
+    print()
+
+
+def bench_batch(number: int) -> None:
+    mnemo = Mnemonic("english")
+    data = [bytes([i % 256]) * 32 for i in range(1000)]
+    codes = [mnemo.to_mnemonic(d) for d in data]
+    count = max(number // 100, 1)
+    print("batch of %d (ms per batch)" % len(data))
+    print("%12s %12s %12s" % ("operation", "loop", "many"))
+    loop = measure(lambda: [mnemo.to_mnemonic(d) for d in data], count) / 1e3
+    many = measure(lambda: mnemo.to_mnemonic_many(data), count) / 1e3
+    print("%12s %12.2f %12.2f" % ("to_mnemonic", loop, many))
+    loop = measure(lambda: [mnemo.check(c) for c in codes], count) / 1e3
+    many = measure(lambda: mnemo.check_many(codes), count) / 1e3
+    print("%12s %12.2f %12.2f" % ("check", loop, many))
+    print()
+
+
+def bench_generate(number: int) -> None:
+    mnemo = Mnemonic("english")
+    count = max(number, 100)
+    print("generate %d mnemonics (ms)" % count)
+    loop = measure(lambda: [mnemo.generate(256) for _ in range(count)], 1) / 1e3
+    stream = measure(lambda: list(mnemo.generate_stream(count, 256)), 1) / 1e3
+    print("%12s %12.2f\n%12s %12.2f\n" % ("generate", loop, "stream", stream))
+
+
+def bench_seed_scaling(number: int) -> None:
+    mnemo = Mnemonic("english")
+    codes = [mnemo.generate() for _ in range(max(number // 10, 64))]
+    cores = os.cpu_count() or 1
+    print("to_seed_many of %d mnemonics (ms per batch)" % len(codes))
+    print("%8s %12s %12s %12s" % ("workers", "threads", "processes", "speedup"))
+    serial = 0.0
+    workers = 1
+    while True:
+        threads = measure(lambda: Mnemonic.to_seed_many(codes, workers=workers), 1)
+        processes = measure(
+            lambda: Mnemonic.to_seed_many(
+                codes, workers=workers, processes=True, chunksize=16
+            ),
+            1,
+        )
+        serial = serial or threads
+        print(
+            "%8d %12.2f %12.2f %11.1fx"
+            % (workers, threads / 1e3, processes / 1e3, serial / threads)
+        )
+        if workers >= cores:
+            break
+        workers = min(workers * 2, cores)
+    print()
+
+
+def bench_construct(number: int) -> None:
+    print("construction (us per call)")
+    for lang in Mnemonic.list_languages():
+        print("%20s %12.2f" % (lang, measure(lambda: Mnemonic(lang), number)))
+    print()
+
+
+def bench_expand(number: int) -> None:
+    mnemo = Mnemonic("english")
+    wordlist = list(mnemo.wordlist)
+    print("expand_word (us per call)")
+    print("%8s %12s %12s" % ("prefix", "scan", "bisect"))
+    for prefix in ["a", "acc", "acce", "zoo", "xx"]:
+        scan = measure(lambda: [w for w in wordlist if w.startswith(prefix)], number)
+        bisect = measure(lambda: mnemo.expand_word(prefix), number)
+        print("%8s %12.2f %12.2f" % (prefix, scan, bisect))
+    print()
+
+
+def bench_detect(number: int) -> None:
+    print("detect_language (us per call)")
+    for lang in Mnemonic.list_languages():
+        mnemo = Mnemonic(lang)
+        code = mnemo.to_mnemonic(bytes(range(32)))
+        if lang == "english":
+            # shares words with french, exercises the exact match pass
+            code = "abandon about"
+        print(
+            "%20s %12.2f" % (lang, measure(lambda: mnemo.detect_language(code), number))
+        )
+    print()
+
+
+def bench_normalize(number: int) -> None:
+    print("normalization (us per call)")
+    print(
+        "%12s %12s %12s %8s %12s %14s"
+        % ("language", "NFKD", "normalize", "speedup", "to_entropy", "to_entropy NFC")
+    )
+    for lang in Mnemonic.list_languages():
+        mnemo = Mnemonic(lang)
+        code = mnemo.to_mnemonic(bytes(range(32)))
+        words = code.split(mnemo.delimiter)
+        nfc = [unicodedata.normalize("NFC", w) for w in words]
+        nfkd = measure(lambda: unicodedata.normalize("NFKD", code), number)
+        fast = measure(lambda: mnemo.normalize_string(code), number)
+        print(
+            "%12s %12.2f %12.2f %7.1fx %12.2f %14.2f"
+            % (
+                lang,
+                nfkd,
+                fast,
+                nfkd / fast,
+                measure(lambda: mnemo.to_entropy(words), number),
+                measure(lambda: mnemo.to_entropy(nfc), number),
+            )
+        )
+    print()
+
+
+def bench_metrics(number: int) -> None:
+    mnemo = Mnemonic("english")
+    code = mnemo.to_mnemonic(bytes(32))
+    print("instrumentation (us per call)")
+    print("%12s %12s %12s" % ("operation", "disabled", "enabled"))
+    for name, stmt in [
+        ("to_entropy", lambda: mnemo.to_entropy(code)),
+        ("check", lambda: mnemo.check(code)),
+    ]:
+        disabled = measure(stmt, number)
+        Mnemonic.metrics = Metrics()
+        enabled = measure(stmt, number)
+        Mnemonic.metrics = None
+        print("%12s %12.2f %12.2f" % (name, disabled, enabled))
+    print()
+
+
+def suite(number: int, languages: t.List[str]) -> t.Dict[str, float]:
+    """Time every public operation, return per-call microseconds by case name."""
+    results = {}
+
+    def run(name: str, stmt: t.Callable[[], object], n: int = number) -> None:
+        results[name] = measure(stmt, max(n, 1))
+        print("%-40s %12.2f" % (name, results[name]))
+
+    print("suite (us per call)")
+    for lang in languages:
+        mnemo = Mnemonic(lang)
+        for words, code in phrases(mnemo).items():
+            case = "%s/%d" % (lang, words)
+            data = mnemo.to_entropy(code)
+            prefixes = mnemo.delimiter.join(w[:4] for w in code.split(mnemo.delimiter))
+            run("generate/" + case, lambda: mnemo.generate(words * 32 // 3))
+            run("to_mnemonic/" + case, lambda: mnemo.to_mnemonic(data))
+            run("to_entropy/" + case, lambda: mnemo.to_entropy(code))
+            run("check/" + case, lambda: mnemo.check(code))
+            run("expand/" + case, lambda: mnemo.expand(prefixes))
+            try:
+                Mnemonic.detect_language(code)
+            except Exception:
+                pass  # phrase is ambiguous between languages, e.g. chinese
+            else:
+                run("detect_language/" + case, lambda: Mnemonic.detect_language(code))
+    mnemo = Mnemonic("english")
+    for words, code in phrases(mnemo).items():
+        run(
+            "to_seed/%d" % words,
+            lambda: Mnemonic.to_seed(code, "TREZOR"),
+            number // 100,
+        )
+    seed = Mnemonic.to_seed(phrases(mnemo)[24])
+    run("to_hd_master_key", lambda: Mnemonic.to_hd_master_key(seed))
+    root = ExtendedKey.parse(Mnemonic.to_hd_master_key(seed))
+    addresses = iter(range(2**31))
+    run(
+        "derive/address",
+        lambda: root.derive("m/44'/0'/0'/0/%d" % next(addresses)).to_xpub(),
+        number // 10,
+    )
+    xprv = b"\x04\x88\xad\xe4" + bytes(range(74))
+    run("b58encode", lambda: b58encode(xprv))
+    encoded = b58encode_check(xprv)
+    run("b58decode_check", lambda: b58decode_check(encoded))
+    print()
+    return results
+
+
+def compare(
+    results: t.Dict[str, float], baseline: t.Dict[str, float], threshold: float
+) -> bool:
+    """Print the change against `baseline`, return False on any regression."""
+    ok = True
+    print("comparison against baseline (us per call)")
+    print("%-40s %12s %12s %8s" % ("case", "baseline", "current", "ratio"))
+    for name, current in results.items():
+        if name not in baseline:
+            continue
+        ratio = current / baseline[name]
+        flag = ""
+        if ratio > threshold:
+            flag = "  REGRESSION"
+            ok = False
+        print(
+            "%-40s %12.2f %12.2f %7.2fx%s"
+            % (name, baseline[name], current, ratio, flag)
+        )
+    print()
+    return ok
+
+
+BENCHMARKS = {
+    "construct": bench_construct,
+    "lookup": bench_lookup,
+    "codec": bench_codec,
+    "batch": bench_batch,
+    "generate": bench_generate,
+    "expand": bench_expand,
+    "detect": bench_detect,
+    "normalize": bench_normalize,
+    "metrics": bench_metrics,
+    "seed_scaling": bench_seed_scaling,
+}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark python-mnemonic")
+    parser.add_argument(
+        "names",
+        nargs="*",
+        metavar="name",
+        help="reports to run: suite, %s (default: all)" % ", ".join(BENCHMARKS),
+    )
+    parser.add_argument("-n", "--number", type=int, default=1000)
+    parser.add_argument(
+        "-l",
+        "--language",
+        action="append",
+        help="suite language, may be repeated (default: %s)"
+        % ", ".join(SUITE_LANGUAGES),
+    )
+    parser.add_argument("-o", "--output", help="save suite results as JSON")
+    parser.add_argument("-b", "--baseline", help="compare suite with saved results")
+    parser.add_argument(
+        "-t",
+        "--threshold",
+        type=float,
+        default=1.25,
+        help="slowdown ratio reported as a regression (default: 1.25)",
+    )
+    args = parser.parse_args()
+    for name in args.names:
+        if name != "suite" and name not in BENCHMARKS:
+            parser.error(
+                "invalid report %r (choose from suite, %s)"
+                % (name, ", ".join(BENCHMARKS))
+            )
+
+    names = args.names or ["suite", *BENCHMARKS]
+    for name in names:
+        if name in BENCHMARKS:
+            BENCHMARKS[name](args.number)
+    if "suite" in names:
+        results = suite(args.number, args.language or SUITE_LANGUAGES)
+        if args.output:
+            with open(args.output, "w") as f:
+                json.dump(
+                    {
+                        "python": platform.python_implementation()
+                        + " "
+                        + platform.python_version(),
+                        "number": args.number,
+                        "results": results,
+                    },
+                    f,
+                    indent=4,
+                    sort_keys=True,
+                )
+        if args.baseline:
+            with open(args.baseline) as f:
+                baseline = json.load(f)["results"]
+            if not compare(results, baseline, args.threshold):
+                sys.exit(1)